@@ -0,0 +1,46 @@
+"""Throughput of Inventory.apply_adjustments against looping adjust_product_stock.
+
+    python -m benchmarks.bench_adjust --products 100000 --lines 10000 100000
+"""
+import argparse
+import random
+import time
+
+from src.inventory import Inventory, Product
+from benchmarks.catalog import generate_rows
+
+
+def make_inventory(size: int) -> Inventory:
+    inventory = Inventory()
+    for sku, name, quantity, supplier_id in generate_rows(size):
+        inventory.add_product(Product(sku, name, quantity + 1000, supplier_id))
+    return inventory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--lines", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    inventory = make_inventory(args.products)
+    skus = list(inventory.products)
+    print(f"{'lines':>8} {'loop (lines/s)':>15} {'batch (lines/s)':>16} {'speedup':>8}")
+    for count in args.lines:
+        lines = [(rng.choice(skus), rng.randint(-5, 5)) for _ in range(count)]
+
+        start = time.perf_counter()
+        for sku, amount in lines:
+            inventory.adjust_product_stock(sku, amount)
+        loop = count / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        report = inventory.apply_adjustments(lines)
+        batch = count / (time.perf_counter() - start)
+        assert report.applied, report.summary()
+        print(f"{count:>8} {loop:>15,.0f} {batch:>16,.0f} {batch / loop:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
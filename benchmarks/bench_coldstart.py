@@ -0,0 +1,59 @@
+"""Measure application cold start: module import times and time to first paint.
+
+Every measurement runs in a fresh interpreter. First paint needs a display and
+is skipped without one.
+
+    python -m benchmarks.bench_coldstart --repeat 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+IMPORT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start, int("pandas" in sys.modules))
+"""
+
+FIRST_PAINT = """
+import time
+start = time.perf_counter()
+from src.gui import App
+from src.inventory import Inventory
+app = App(Inventory())
+app.update()
+painted = time.perf_counter() - start
+app.update()
+print(painted, time.perf_counter() - start)
+app.destroy()
+"""
+
+
+def run(code: str) -> list:
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return [float(value) for value in output.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in ("src.inventory", "src.gui"):
+        results = [run(IMPORT.format(module=module)) for _ in range(args.repeat)]
+        best = min(seconds for seconds, _ in results)
+        pandas_loaded = "yes" if results[0][1] else "no"
+        print(f"import {module:<14} {best * 1000:8.1f} ms   pandas imported: {pandas_loaded}")
+
+    if sys.platform != "win32" and not os.environ.get("DISPLAY"):
+        print("first paint: skipped (no display)")
+        return
+    results = [run(FIRST_PAINT) for _ in range(args.repeat)]
+    print(f"first paint          {min(r[0] for r in results) * 1000:8.1f} ms")
+    print(f"icons loaded         {min(r[1] for r in results) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Stress ConcurrentInventory from several threads and report adjustments per second.
+
+Every thread applies random +/- adjustments to a shared pool of SKUs and keeps
+a ledger of the ones that succeeded. At the end each SKU must equal its
+starting quantity plus the ledger (no lost updates) and no quantity may ever
+have gone negative.
+
+    python -m benchmarks.bench_concurrency --threads 1 2 4 8
+"""
+import argparse
+import random
+import threading
+import time
+from collections import Counter
+
+from src.concurrency import ConcurrentInventory
+from src.inventory import Product
+
+
+def stress(threads: int, products: int, operations: int, seed: int = 0):
+    inventory = ConcurrentInventory()
+    for i in range(products):
+        inventory.add_product(Product(f"ABC-{i:04d}", f"Item {i}", 5, "SUP1"))
+    skus = list(inventory.products)
+    ledgers = [Counter() for _ in range(threads)]
+    rejected = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(n: int):
+        rng = random.Random(seed + n)
+        ledger = ledgers[n]
+        barrier.wait()
+        for _ in range(operations):
+            sku = rng.choice(skus)
+            amount = rng.choice((-3, -1, 1, 2))
+            try:
+                inventory.adjust_product_stock(sku, amount)
+                ledger[sku] += amount
+            except ValueError:
+                rejected[n] += 1
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = Counter()
+    for ledger in ledgers:
+        total.update(ledger)
+    for sku in skus:
+        quantity = inventory.products[sku].quantity
+        assert quantity >= 0, f"{sku} went negative: {quantity}"
+        assert quantity == 5 + total[sku], f"Lost update on {sku}: {quantity} != {5 + total[sku]}"
+    assert inventory.low_stock_count() == sum(1 for sku in skus if inventory.products[sku].quantity <= 5)
+    return threads * operations / elapsed, sum(rejected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=50_000, help="adjustments per thread")
+    args = parser.parse_args()
+
+    print(f"{'threads':>7} {'adjustments/s':>14} {'rejected':>9}  invariants")
+    for threads in args.threads:
+        rate, rejected = stress(threads, args.products, args.operations)
+        print(f"{threads:>7} {rate:>14,.0f} {rejected:>9}  ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the vectorized bulk loader with the original per-row iterrows() loader.
+
+    python -m benchmarks.bench_load --sizes 10000 100000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from src.inventory import Inventory, Product
+from benchmarks.catalog import write_catalog_csv
+
+
+def legacy_load(inventory: Inventory, filepath: str):
+    inventory.products.clear()
+    df = pd.read_csv(filepath)
+    for index, row in df.iterrows():
+        product = Product(
+            sku=row["sku"],
+            name=row["name"],
+            quantity=int(row["quantity"]),
+            supplier_id=row["supplier_id"]
+        )
+        inventory.products[product.sku] = product
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--skip-legacy-above", type=int, default=None,
+                        help="skip the iterrows() path for catalogs larger than this")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'iterrows (s)':>14} {'bulk (s)':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"catalog_{size}.csv")
+            write_catalog_csv(path, size)
+
+            bulk = timed(Inventory().load_from_file, path)
+            if args.skip_legacy_above is not None and size > args.skip_legacy_above:
+                print(f"{size:>10} {'skipped':>14} {bulk:>10.3f} {'-':>8}")
+                continue
+            legacy = timed(legacy_load, Inventory(), path)
+            print(f"{size:>10} {legacy:>14.3f} {bulk:>10.3f} {legacy / bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare the memory held by the dict-of-Product layout with the columnar store.
+
+    python -m benchmarks.bench_memory --sizes 100000 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from src.columnar import ColumnarProductStore
+from src.inventory import Inventory, Product
+from benchmarks.catalog import generate_rows
+
+
+def measure(make_store, size):
+    # Rows are generated inside the traced region so the per-row strings a
+    # loader would create are counted for both layouts.
+    gc.collect()
+    tracemalloc.start()
+    inventory = Inventory(store=make_store())
+    for sku, name, quantity, supplier_id in generate_rows(size):
+        inventory.add_product(Product(sku, name, quantity, supplier_id))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'dict (MB)':>10} {'columnar (MB)':>14} {'ratio':>6}")
+    for size in args.sizes:
+        as_dict = measure(dict, size)
+        columnar = measure(ColumnarProductStore, size)
+        print(f"{size:>10} {as_dict / 1e6:>10.1f} {columnar / 1e6:>14.1f} {as_dict / columnar:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Time a multi-branch import against the number of worker processes.
+
+Writes ``--files`` branch files of ``--rows`` rows each (CSV, or XLSX with
+--xlsx); each file shares half its SKUs with the previous file and half with
+the next. Then loads the whole directory with Inventory.load_from_files for
+each worker count.
+
+    python -m benchmarks.bench_multiload --files 8 --rows 200000 --workers 1 2 4 8
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+
+from src.inventory import Inventory
+from benchmarks.catalog import write_catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--xlsx", action="store_true", help="write the branch files as .xlsx")
+    parser.add_argument("--policy", default="sum")
+    args = parser.parse_args()
+
+    extension = "xlsx" if args.xlsx else "csv"
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in range(args.files):
+            # Branch n lists SKUs n*rows/2 .. n*rows/2 + rows of the same sequence.
+            write_catalog(os.path.join(tmp, f"branch_{n:02d}.{extension}"), args.rows, first=n * args.rows // 2)
+        paths = sorted(glob.glob(os.path.join(tmp, f"*.{extension}")))
+
+        print(f"{args.files} x {args.rows} {extension} rows, {os.cpu_count()} core(s), policy={args.policy}")
+        print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'products':>10}")
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            inventory = Inventory()
+            start = time.perf_counter()
+            report = inventory.load_from_files(paths, policy=args.policy, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x {report.rows_loaded:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Time reconciling a stock-count file against an inventory of the same size.
+
+The count file is the catalogue with roughly 1% of quantities changed, 0.5%
+of rows dropped and 0.5% new rows, so the time per row should stay flat as
+the catalogue grows.
+
+    python -m benchmarks.bench_reconcile --sizes 100000 1000000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from src.inventory import Inventory, Product
+from benchmarks.catalog import FIELDNAMES, generate_rows
+
+
+def write_count(path: str, rows, seed: int = 1):
+    rng = random.Random(seed)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for n, (sku, name, quantity, supplier_id) in enumerate(rows):
+            roll = rng.random()
+            if roll < 0.005:
+                continue
+            if roll < 0.015:
+                quantity += rng.choice((-2, -1, 1, 3))
+                quantity = max(quantity, 0)
+            writer.writerow((sku, name, quantity, supplier_id))
+            if roll > 0.995:
+                writer.writerow((f"ZZ{chr(65 + n % 26)}-{n % 10000:04d}", "New item", 1, "SUP1"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'seconds':>9} {'us/row':>7} {'peak MB':>8} {'changed':>8} {'added':>6} {'removed':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            rows = list(generate_rows(size))
+            inventory = Inventory()
+            for row in rows:
+                inventory.add_product(Product.from_validated(*row))
+            path = os.path.join(tmp, f"count_{size}.csv")
+            write_count(path, rows)
+            del rows
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = inventory.reconcile(path)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{size:>10} {elapsed:>9.2f} {elapsed / size * 1e6:>7.2f} {peak / 1e6:>8.1f} "
+                  f"{len(result.changed):>8} {len(result.added):>6} {len(result.removed):>8}")
+
+
+if __name__ == "__main__":
+    main()
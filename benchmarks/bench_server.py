@@ -0,0 +1,114 @@
+"""Load generator for src.server: reports requests/s and p50/p99 latency.
+
+By default a local instance serving a synthetic catalogue is started in a
+child process; pass --port to target an instance that is already running.
+
+    python -m benchmarks.bench_server --clients 64 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+
+SERVER = """
+import asyncio
+from src.inventory import Inventory, Product
+from src.server import InventoryServer
+from benchmarks.catalog import generate_rows
+
+async def main():
+    inventory = Inventory()
+    for sku, name, quantity, supplier_id in generate_rows({products}):
+        inventory.add_product(Product(sku, name, quantity + 1000, supplier_id))
+    server = InventoryServer(inventory)
+    print(await server.start(port=0), flush=True)
+    await asyncio.Event().wait()
+
+asyncio.run(main())
+"""
+
+
+async def client(port: int, skus, count: int, adjust_ratio: float, latencies: list, seed: int):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            sku = rng.choice(skus)
+            if rng.random() < adjust_ratio:
+                body = json.dumps({"amount": rng.choice((-1, 1))}).encode()
+                request = f"POST /products/{sku}/adjust HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+            else:
+                request = f"GET /products/{sku} HTTP/1.1\r\n\r\n".encode()
+            start = time.perf_counter()
+            writer.write(request)
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line == b"\r\n":
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def fetch_skus(port: int, limit: int):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"GET /products HTTP/1.1\r\nConnection: close\r\n\r\n")
+    response = await reader.read()
+    writer.close()
+    body = response.partition(b"\r\n\r\n")[2]
+    chunks = []
+    while True:
+        size, _, body = body.partition(b"\r\n")
+        size = int(size, 16)
+        if not size:
+            break
+        chunks.append(body[:size])
+        body = body[size + 2:]
+    return [product["sku"] for product in json.loads(b"".join(chunks))[:limit]]
+
+
+async def run(args, port: int):
+    skus = await fetch_skus(port, 10_000)
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, skus, args.requests, args.adjust_ratio, latencies, n)
+                           for n in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"clients={args.clients} requests={len(latencies)} adjust_ratio={args.adjust_ratio}")
+    print(f"throughput {len(latencies) / elapsed:,.0f} req/s")
+    print(f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms   "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, help="use an already running server")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--adjust-ratio", type=float, default=0.5)
+    args = parser.parse_args()
+
+    if args.port:
+        asyncio.run(run(args, args.port))
+        return
+    server = subprocess.Popen([sys.executable, "-c", SERVER.format(products=args.products)],
+                              stdout=subprocess.PIPE, text=True)
+    try:
+        port = int(server.stdout.readline())
+        asyncio.run(run(args, port))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compare the in-memory Inventory with the SQLite backend on import and on the table's queries.
+
+    python -m benchmarks.bench_sqlite --sizes 100000 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.inventory import Inventory
+from src.sqlite_store import SQLiteInventory
+from benchmarks.catalog import write_catalog_csv
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def first_page(inventory, *args):
+    # What the virtualized table asks for: the row count and one screenful.
+    view = inventory.select_products(*args)
+    return len(view), [view[i] for i in range(min(40, len(view)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'backend':>8} {'import (s)':>11} {'low stock (s)':>14} "
+          f"{'search page (s)':>16} {'sorted page (s)':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"catalog_{size}.csv")
+            write_catalog_csv(path, size)
+            backends = [("memory", Inventory()),
+                        ("sqlite", SQLiteInventory(os.path.join(tmp, f"catalog_{size}.db")))]
+            for label, inventory in backends:
+                load, _ = timed(inventory.load_from_file, path)
+                low, _ = timed(inventory.get_low_stock_products)
+                search, _ = timed(first_page, inventory, "product 12")
+                ordered, _ = timed(first_page, inventory, None, "quantity")
+                print(f"{size:>10} {label:>8} {load:>11.3f} {low:>14.3f} {search:>16.3f} {ordered:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare loading the inventory from CSV with loading it from a binary snapshot.
+
+Each load runs in a fresh interpreter so import costs (pandas for the CSV path)
+are included, as they are on a real application start.
+
+    python -m benchmarks.bench_startup --sizes 100000 1000000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.catalog import write_catalog_csv
+
+LOAD_CSV = "from src.inventory import Inventory; Inventory().load_from_file({path!r})"
+LOAD_SNAPSHOT = "from src.inventory import Inventory; Inventory().load_snapshot({path!r})"
+BUILD_SNAPSHOT = ("from src.inventory import Inventory; i = Inventory(); "
+                  "i.load_from_file({csv!r}); i.save_snapshot({path!r})")
+
+
+def run(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline = min(run("pass") for _ in range(args.repeat))
+    print(f"interpreter start: {baseline:.3f}s (included below)")
+    print(f"{'rows':>10} {'csv (s)':>9} {'snapshot (s)':>13} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            csv_path = os.path.join(tmp, f"catalog_{size}.csv")
+            snapshot_path = os.path.join(tmp, f"catalog_{size}.invsnap")
+            write_catalog_csv(csv_path, size)
+            run(BUILD_SNAPSHOT.format(csv=csv_path, path=snapshot_path))
+
+            from_csv = min(run(LOAD_CSV.format(path=csv_path)) for _ in range(args.repeat))
+            from_snapshot = min(run(LOAD_SNAPSHOT.format(path=snapshot_path)) for _ in range(args.repeat))
+            print(f"{size:>10} {from_csv:>9.3f} {from_snapshot:>13.3f} {from_csv / from_snapshot:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
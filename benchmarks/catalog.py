@@ -0,0 +1,111 @@
+"""Seeded synthetic catalogues for the benchmarks.
+
+Rows look like a real stock list rather than uniform noise:
+
+* SKUs are valid ``ABC-1234`` codes, unique without keeping a set: row ``i``
+  maps to a slot of the 175,760,000-code space through a fixed permutation,
+  so 10M-row catalogues cost no extra memory.
+* Names combine a brand-ish adjective, a product noun and a pack size, with
+  nouns drawn Zipf-like so some words ("Cable", "Filter") are everywhere.
+* Suppliers follow a Zipf distribution (a few large suppliers, a long tail).
+* Quantities are exponential with a mean of ~40, so roughly one product in
+  seven is at or below the low-stock threshold, plus a spike of zeros.
+
+The same ``count``, ``seed`` and ``first`` always give the same rows.
+``first`` starts the SKU sequence further along, so catalogues with the same
+seed and overlapping ``first``..``first + count`` ranges share those SKUs
+(with their own names and quantities).
+
+    python -m benchmarks.catalog --rows 1000000 --out data/catalog_1m.csv
+"""
+import argparse
+import csv
+import itertools
+import random
+import string
+
+FIELDNAMES = ["sku", "name", "quantity", "supplier_id"]
+
+SKU_SPACE = 26 ** 3 * 10_000
+# Coprime with SKU_SPACE (2^7 * 5^4 * 13^3), so i -> (i * STRIDE + offset) % SKU_SPACE is a permutation.
+STRIDE = 104_729 * 7_919
+
+ADJECTIVES = ["Premium", "Basic", "Heavy Duty", "Compact", "Deluxe", "Eco", "Classic", "Pro", "Ultra",
+              "Mini", "Industrial", "Organic", "Wireless", "Stainless", "Portable", "Smart", "Rugged",
+              "Slim", "Reinforced", "Value"]
+NOUNS = ["Cable", "Filter", "Bolt", "Battery", "Bracket", "Hose", "Lamp", "Adapter", "Valve", "Gasket",
+         "Charger", "Switch", "Fuse", "Tape", "Glove", "Sensor", "Bearing", "Clamp", "Nozzle", "Relay",
+         "Socket", "Spring", "Washer", "Hinge", "Pump", "Fan", "Brush", "Blade", "Mount", "Panel",
+         "Drill Bit", "Cartridge", "Screen", "Router", "Keyboard", "Mouse", "Headset", "Notebook",
+         "Marker", "Stapler"]
+PACK_SIZES = ["", "", "", " 2-Pack", " 6-Pack", " 12-Pack", " 500ml", " 1L", " 5m", " 10m", " Large", " Small"]
+
+
+def _zipf_weights(n: int, exponent: float):
+    return list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, n + 1)))
+
+
+def sku_for(index: int, seed: int = 0) -> str:
+    slot = (index * STRIDE + seed * 7_654_321) % SKU_SPACE
+    letters, digits = divmod(slot, 10_000)
+    first, rest = divmod(letters, 26 * 26)
+    second, third = divmod(rest, 26)
+    upper = string.ascii_uppercase
+    return f"{upper[first]}{upper[second]}{upper[third]}-{digits:04d}"
+
+
+def generate_rows(count: int, seed: int = 0, suppliers: int = 500, first: int = 0):
+    if first + count > SKU_SPACE:
+        raise ValueError(f"At most {SKU_SPACE} unique SKUs can be generated")
+    rng = random.Random(seed + first * 1_000_003)
+    choices, random_ = rng.choices, rng.random
+    noun_weights = _zipf_weights(len(NOUNS), 1.0)
+    supplier_weights = _zipf_weights(suppliers, 1.1)
+    supplier_ids = [f"SUP{n}" for n in range(1, suppliers + 1)]
+    batch = 1024
+    for start in range(0, count, batch):
+        size = min(batch, count - start)
+        nouns = choices(NOUNS, cum_weights=noun_weights, k=size)
+        owners = choices(supplier_ids, cum_weights=supplier_weights, k=size)
+        for offset in range(size):
+            index = first + start + offset
+            name = f"{rng.choice(ADJECTIVES)} {nouns[offset]}{rng.choice(PACK_SIZES)}"
+            quantity = 0 if random_() < 0.03 else int(rng.expovariate(1 / 40))
+            yield sku_for(index, seed), name, quantity, owners[offset]
+
+
+def write_catalog_csv(path: str, count: int, seed: int = 0, first: int = 0):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(generate_rows(count, seed, first=first))
+
+
+def write_catalog_xlsx(path: str, count: int, seed: int = 0, first: int = 0):
+    import openpyxl
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(FIELDNAMES)
+    for row in generate_rows(count, seed, first=first):
+        sheet.append(row)
+    workbook.save(path)
+
+
+def write_catalog(path: str, count: int, seed: int = 0, first: int = 0):
+    if path.lower().endswith(".xlsx"):
+        write_catalog_xlsx(path, count, seed, first)
+    else:
+        write_catalog_csv(path, count, seed, first)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help=".csv or .xlsx")
+    args = parser.parse_args()
+    write_catalog(args.out, args.rows, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""Reproducible benchmark suite with stored baselines and a regression report.
+
+Every case runs against catalogues from benchmarks.catalog (seeded, so the
+same sizes always mean the same rows) and reports the best of ``--repeat``
+runs:
+
+    load_csv, load_xlsx, save_csv, save_xlsx    file round trips (XLSX up to --xlsx-max rows)
+    adjust_batch                                apply_adjustments with 10k lines
+    low_stock                                   get_low_stock_products
+    search_substring, search_prefix, search_token
+    sort_quantity, sort_name                    sorted_products over the whole catalogue
+    refresh_render                              App.compute_table_rows + ProductTable.render of one viewport
+
+Without a display, refresh_render drives the real compute_table_rows and
+render code against stand-in label objects, so it measures the application's
+share of a refresh but not Tk's drawing.
+
+    python -m benchmarks.suite --save-baseline benchmarks/baselines/local.json
+    python -m benchmarks.suite --baseline benchmarks/baselines/local.json --fail-on-regression
+
+Baselines are only comparable on the machine (or CI runner type) and Python
+version that recorded them, so none is committed. With --baseline, cases slower than the baseline by more than
+--tolerance are flagged, and --fail-on-regression turns that into exit code 1.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.inventory import Inventory, Product
+from benchmarks.catalog import generate_rows, write_catalog
+
+VIEWPORT_ROWS = 20
+ADJUST_LINES = 10_000
+
+
+def best_of(func: Callable[[], object], repeat: int, warmup: bool = True) -> float:
+    if warmup:
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def build_inventory(size: int) -> Inventory:
+    inventory = Inventory()
+    for row in generate_rows(size):
+        inventory.add_product(Product.from_validated(*row))
+    return inventory
+
+
+class _Label:
+    # Stand-in for a CTkLabel when there is no display: keeps what render() sets.
+    def __init__(self):
+        self.options = {"text_color": "black"}
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def cget(self, option):
+        return self.options[option]
+
+
+def headless_refresh(inventory: Inventory) -> Callable[[], object]:
+    from src.gui import App, ProductTable
+
+    app = SimpleNamespace(inventory=inventory, SORT_FIELDS=App.SORT_FIELDS)
+    table = SimpleNamespace(inventory=inventory, offset=0, products=[], HEADERS=ProductTable.HEADERS,
+                            rows=[[_Label() for _ in ProductTable.HEADERS] for _ in range(VIEWPORT_ROWS)],
+                            scrollbar=SimpleNamespace(set=lambda first, last: None))
+
+    def refresh():
+        products = App.compute_table_rows(app, None, "cable", "Quantity", True, is_stale=lambda: False)
+        table.products = products
+        ProductTable.render(table)
+        return table
+    return refresh
+
+
+def display_refresh(inventory: Inventory) -> Callable[[], object]:
+    from src.gui import App
+
+    app = App(inventory)
+    app.geometry(f"1151x{200 + VIEWPORT_ROWS * 32}")
+    app.update()
+
+    def refresh():
+        app.refresh_table(search_query="cable")
+        scheduler = app.refresh_scheduler
+        while scheduler.delivered != scheduler.generation:
+            app.update()
+            time.sleep(0.001)
+        app.update_idletasks()
+    return refresh
+
+
+def run_size(size: int, repeat: int, xlsx_max: int, tmp: str, skip: List[str]) -> Dict[str, float]:
+    results = {}
+
+    def record(case: str, func: Callable[[], object], warmup: bool = True):
+        if case in skip:
+            return
+        results[case] = best_of(func, repeat, warmup)
+        print(f"{case:>18} {size:>10} {results[case]:>11.4f}s", flush=True)
+
+    formats = ["csv"] + (["xlsx"] if size <= xlsx_max else [])
+    for fmt in formats:
+        source = os.path.join(tmp, f"catalog_{size}.{fmt}")
+        write_catalog(source, size)
+        record(f"load_{fmt}", lambda: Inventory().load_from_file(source, chunksize=50_000), warmup=False)
+
+    inventory = build_inventory(size)
+    for fmt in formats:
+        target = os.path.join(tmp, f"saved_{size}.{fmt}")
+        record(f"save_{fmt}", lambda: inventory.save_to_file(target), warmup=False)
+
+    rng = random.Random(size)
+    skus = list(inventory.products)
+    lines = [(rng.choice(skus), rng.randint(1, 3)) for _ in range(ADJUST_LINES)]
+    record("adjust_batch", lambda: inventory.apply_adjustments(lines))
+
+    record("low_stock", inventory.get_low_stock_products)
+    # Alternating queries keep the search index's last-query cache from answering.
+    record("search_substring", lambda: (inventory.search_skus("cable"), inventory.search_skus("lamp")))
+    record("search_prefix", lambda: inventory.search_skus(skus[0][:2], mode="prefix"))
+    record("search_token", lambda: inventory.search_skus("pro cab", mode="token"))
+    record("sort_quantity", lambda: inventory.sorted_products("quantity"))
+    record("sort_name", lambda: inventory.sorted_products("name", reverse=True))
+
+    if "refresh_render" not in skip:
+        refresh = display_refresh(inventory) if os.environ.get("DISPLAY") else headless_refresh(inventory)
+        record("refresh_render", refresh)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float,
+            min_delta: float) -> Tuple[List[str], str]:
+    """Return the regressed keys and a printable report of current vs. baseline times."""
+    regressions = []
+    lines = [f"{'case':>26} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for key in sorted(set(results) | set(baseline), key=_sort_key):
+        old, new = baseline.get(key), results.get(key)
+        if old is None or new is None:
+            lines.append(f"{key:>26} {_fmt(old):>10} {_fmt(new):>10} {'-':>7}  (not in both runs)")
+            continue
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance and new - old > min_delta:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        elif ratio < 1 / (1 + tolerance) and old - new > min_delta:
+            flag = "  faster"
+        lines.append(f"{key:>26} {old:>10.4f} {new:>10.4f} {ratio:>6.2f}x{flag}")
+    lines.append(f"{len(regressions)} regression(s) beyond {tolerance:.0%}")
+    return regressions, "\n".join(lines)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.4f}"
+
+
+def _sort_key(key: str):
+    case, _, size = key.partition("@")
+    return int(size or 0), case
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--xlsx-max", type=int, default=100_000, help="skip XLSX cases above this many rows")
+    parser.add_argument("--skip", nargs="*", default=[], help="case names to leave out")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the results as a baseline file")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against this baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--min-delta", type=float, default=0.002,
+                        help="ignore differences smaller than this many seconds")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':>18} {'rows':>10} {'best':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            for case, seconds in run_size(size, args.repeat, args.xlsx_max, tmp, args.skip).items():
+                results[f"{case}@{size}"] = seconds
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump({"meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                                "processor": platform.processor() or platform.machine(),
+                                "recorded": datetime.date.today().isoformat(), "repeat": args.repeat},
+                       "results": results}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions, report = compare(results, baseline["results"], args.tolerance, args.min_delta)
+        print(f"\nCompared with {args.baseline} (recorded {baseline['meta'].get('recorded', '?')} "
+              f"on {baseline['meta'].get('platform', '?')})")
+        print(report)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class LineResult(NamedTuple):
+    line: int
+    sku: str
+    amount: int
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class BatchReport:
+    # Per-line results are built on request; failures are recorded per SKU.
+    # line_numbers are the source lines of the input (see parse_adjustment_lines);
+    # without them lines are numbered by position.
+    def __init__(self, lines: List[Tuple[str, int]], failures: Dict[str, str], applied: bool,
+                 products_changed: int = 0, line_numbers: Optional[Sequence[int]] = None):
+        self._lines = lines
+        self.failures = failures
+        self.applied = applied
+        self.products_changed = products_changed
+        self.line_numbers = line_numbers
+
+    @property
+    def lines(self) -> List[LineResult]:
+        failures = self.failures
+        numbers = self.line_numbers or range(1, len(self._lines) + 1)
+        return [LineResult(number, sku, amount, failures.get(sku, ""))
+                for number, (sku, amount) in zip(numbers, self._lines)]
+
+    @property
+    def errors(self) -> List[LineResult]:
+        return [line for line in self.lines if not line.ok] if self.failures else []
+
+    def summary(self, limit: int = 10) -> str:
+        if self.applied:
+            return f"Applied {len(self._lines)} line(s) to {self.products_changed} product(s)."
+        errors = self.errors
+        lines = [f"Nothing applied: {len(errors)} of {len(self._lines)} line(s) failed:"]
+        for error in errors[:limit]:
+            lines.append(f"  line {error.line} ({error.sku}): {error.error}")
+        if len(errors) > limit:
+            lines.append(f"  ... and {len(errors) - limit} more")
+        return "\n".join(lines)
+
+
+def parse_adjustment_lines(text: str) -> Tuple[List[Tuple[str, int]], List[int]]:
+    # One "SKU, amount" (or "SKU amount") per line; blank lines are skipped.
+    # Returns the (sku, amount) pairs and the text line each one came from.
+    lines = []
+    numbers = []
+    for number, raw in enumerate(text.splitlines(), start=1):
+        parts = raw.replace(",", " ").split()
+        if not parts:
+            continue
+        if len(parts) != 2:
+            raise ValueError(f"Line {number}: expected 'SKU, amount', got '{raw.strip()}'")
+        try:
+            lines.append((parts[0], int(parts[1])))
+        except ValueError:
+            raise ValueError(f"Line {number}: amount '{parts[1]}' is not a whole number")
+        numbers.append(number)
+    return lines, numbers
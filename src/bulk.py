@@ -0,0 +1,108 @@
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Set, Tuple
+
+# pandas is imported on first file I/O rather than with the module; it is the
+# single most expensive import in the application.
+if TYPE_CHECKING:
+    import pandas as pd
+
+REQUIRED_COLUMNS = ["sku", "name", "quantity", "supplier_id"]
+SKU_PATTERN = r"^[A-Z]{3}-\d{4}$"
+
+# Data rows start on line 2 of a spreadsheet, after the header.
+FIRST_DATA_LINE = 2
+
+
+class RowError(NamedTuple):
+    line: int
+    sku: str
+    message: str
+
+
+class LoadReport:
+    def __init__(self):
+        self.rows_read = 0
+        self.rows_loaded = 0
+        self.errors: List[RowError] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def summary(self, limit: int = 10) -> str:
+        if self.ok:
+            return f"Loaded {self.rows_loaded} of {self.rows_read} rows."
+        lines = [f"{len(self.errors)} invalid row(s) out of {self.rows_read}:"]
+        for error in self.errors[:limit]:
+            lines.append(f"  line {error.line} ({error.sku}): {error.message}")
+        if len(self.errors) > limit:
+            lines.append(f"  ... and {len(self.errors) - limit} more")
+        return "\n".join(lines)
+
+
+class ImportValidationError(ValueError):
+    def __init__(self, report: LoadReport):
+        super().__init__(report.summary())
+        self.report = report
+
+
+def read_frame(filepath: str) -> "pd.DataFrame":
+    import pandas as pd
+    file_extension = filepath.split('.')[-1].lower()
+    if file_extension == 'csv':
+        return pd.read_csv(filepath)
+    elif file_extension in ['xlsx', 'xls']:
+        return pd.read_excel(filepath)
+    else:
+        raise ValueError("Unsupported file format. Please use .csv or .xlsx")
+
+
+def validate_frame(df: "pd.DataFrame", line_offset: int = FIRST_DATA_LINE,
+                   seen: Optional[Set[str]] = None) -> Tuple["pd.DataFrame", List[RowError]]:
+    """Check a whole frame column-wise and return its valid rows plus one error per bad row.
+
+    ``seen`` carries SKUs accepted from earlier chunks so duplicates are caught
+    across chunk boundaries; it is updated in place with the SKUs accepted here.
+    """
+    import pandas as pd
+    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+    sku = df["sku"].astype("string")
+    quantity = pd.to_numeric(df["quantity"], errors="coerce")
+
+    bad_sku = ~sku.str.match(SKU_PATTERN, na=False)
+    bad_quantity = quantity.isna() | (quantity != quantity.round())
+    negative = ~bad_quantity & (quantity < 0)
+    # Only rows that pass the other checks count as a SKU's first occurrence.
+    checked = ~(bad_sku | bad_quantity | negative)
+    duplicate = checked & sku.where(checked).duplicated(keep="first")
+    if seen:
+        duplicate |= checked & sku.isin(seen)
+
+    bad = (bad_sku | bad_quantity | negative | duplicate).to_numpy()
+    errors = []
+    if bad.any():
+        positions = bad.nonzero()[0]
+        for pos, value, b_sku, b_qty, b_neg in zip(
+                positions, sku.iloc[positions].fillna(""),
+                bad_sku.iloc[positions], bad_quantity.iloc[positions], negative.iloc[positions]):
+            if b_sku:
+                message = f"Invalid SKU format '{value}'. Expected format: ABC-1234"
+            elif b_qty:
+                message = f"Quantity '{df['quantity'].iloc[pos]}' is not a whole number"
+            elif b_neg:
+                message = "Quantity cannot be negative on product creation"
+            else:
+                message = f"Duplicate SKU {value}"
+            errors.append(RowError(int(pos) + line_offset, str(value), message))
+
+    valid = pd.DataFrame({
+        "sku": sku[~bad].astype(str),
+        "name": df["name"][~bad].fillna("").astype(str),
+        "quantity": quantity[~bad].astype("int64"),
+        "supplier_id": df["supplier_id"][~bad].fillna("").astype(str),
+    })
+    if seen is not None:
+        seen.update(valid["sku"].tolist())
+    return valid, errors
@@ -0,0 +1,136 @@
+import sys
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, List
+
+from .inventory import Product
+
+
+class _Categories:
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value))
+            self.codes[self.values[code]] = code
+        return code
+
+
+class ProductView(Product):
+    """A Product whose fields live in a ColumnarProductStore row; writes go straight to the columns."""
+
+    __slots__ = ("_store", "_sku")
+
+    def __init__(self, store: "ColumnarProductStore", sku: str):
+        self._store = store
+        self._sku = sku
+
+    @property
+    def _row(self) -> int:
+        return self._store._rows[self._sku]
+
+    @property
+    def sku(self) -> str:
+        return self._sku
+
+    @property
+    def name(self) -> str:
+        return self._store._names.values[self._store._name_codes[self._row]]
+
+    @name.setter
+    def name(self, value: str):
+        self._store._name_codes[self._row] = self._store._names.code(value)
+
+    @property
+    def quantity(self) -> int:
+        return self._store._quantities[self._row]
+
+    @quantity.setter
+    def quantity(self, value: int):
+        self._store._quantities[self._row] = value
+
+    @property
+    def supplier_id(self) -> str:
+        return self._store._suppliers.values[self._store._supplier_codes[self._row]]
+
+    @supplier_id.setter
+    def supplier_id(self, value: str):
+        self._store._supplier_codes[self._row] = self._store._suppliers.code(value)
+
+    def __repr__(self):
+        return f"ProductView({self.sku!r}, {self.name!r}, {self.quantity}, {self.supplier_id!r})"
+
+
+class ColumnarProductStore(MutableMapping):
+    """Drop-in replacement for the ``Inventory.products`` dict that keeps one column per field.
+
+    Names and supplier IDs are stored as codes into shared category tables
+    (catalogue names repeat heavily), quantities live in a typed int64 array
+    and the only per-product objects are the SKU keys of the row map. Rows of
+    deleted products are reused by later inserts. Product objects are only
+    created as views when a caller asks for one.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._rows: Dict[str, int] = {}
+        self._free = array("I")
+        self._names = _Categories()
+        self._name_codes = array("I")
+        self._suppliers = _Categories()
+        self._supplier_codes = array("I")
+        self._quantities = array("q")
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __contains__(self, sku) -> bool:
+        return sku in self._rows
+
+    def __getitem__(self, sku: str) -> ProductView:
+        if sku not in self._rows:
+            raise KeyError(sku)
+        return ProductView(self, sku)
+
+    def __setitem__(self, sku: str, product: Product):
+        row = self._rows.get(sku)
+        if row is None:
+            self._append(sku, product.name, product.quantity, product.supplier_id)
+        else:
+            self._name_codes[row] = self._names.code(product.name)
+            self._quantities[row] = product.quantity
+            self._supplier_codes[row] = self._suppliers.code(product.supplier_id)
+
+    def __delitem__(self, sku: str):
+        self._free.append(self._rows.pop(sku))
+
+    def _append(self, sku: str, name: str, quantity: int, supplier_id: str):
+        name_code, supplier_code = self._names.code(name), self._suppliers.code(supplier_id)
+        if self._free:
+            row = self._rows[sku] = self._free.pop()
+            self._name_codes[row] = name_code
+            self._quantities[row] = quantity
+            self._supplier_codes[row] = supplier_code
+        else:
+            self._rows[sku] = len(self._quantities)
+            self._name_codes.append(name_code)
+            self._quantities.append(quantity)
+            self._supplier_codes.append(supplier_code)
+
+    def load_columns(self, skus: Iterable[str], names: Iterable[str],
+                     quantities: Iterable[int], supplier_ids: Iterable[str]):
+        for sku, name, quantity, supplier_id in zip(skus, names, quantities, supplier_ids):
+            self._append(sku, name, quantity, supplier_id)
+
+    def quantities(self, skus: Iterable[str]) -> Dict[str, int]:
+        rows, quantities = self._rows, self._quantities
+        return {sku: quantities[rows[sku]] for sku in skus if sku in rows}
@@ -0,0 +1,169 @@
+import threading
+from contextlib import ExitStack, contextmanager, nullcontext
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .batch import BatchReport
+from .inventory import Inventory, Product
+from .reports import SupplierSummary
+
+
+class ConcurrentInventory(Inventory):
+    """An Inventory that several threads can mutate at once.
+
+    Each SKU maps to one of ``stripes`` locks, so the check-then-update in
+    ``Product.adjust_stock`` is atomic per SKU while adjustments to different
+    SKUs proceed independently. The shared indexes sit behind one re-entrant
+    lock that is only held for the index update itself. Lock order is always
+    stripe(s) first, in ascending order, then the index lock.
+
+    Reading products (``products[sku]``, ``list_all_products``) takes no lock:
+    with the default dict store each read sees a consistent snapshot of the
+    mapping. Index-backed queries hold the index lock, and adds, deletes and
+    whole-catalogue swaps change the mapping and the indexes together under
+    it, so a query never meets a SKU one of them has and the other lacks. A
+    query that first has to build an index (which walks every product) also
+    holds every stripe. Whole-catalogue replacements (file and snapshot loads)
+    and journal checkpoints hold every stripe, so mutations compact the
+    journal only after releasing their own.
+    """
+
+    def __init__(self, store=None, stripes: int = 64):
+        super().__init__(store)
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._index_lock = threading.RLock()
+        self._query_state = threading.local()
+
+    def _stripe(self, sku: str) -> threading.Lock:
+        return self._stripes[hash(sku) % len(self._stripes)]
+
+    @contextmanager
+    def _querying(self, builds_index: bool):
+        # Queries call each other (select_products -> search_skus); only the
+        # outermost one takes locks, and it already knows which indexes it builds.
+        if getattr(self._query_state, "active", False):
+            yield
+            return
+        self._query_state.active = True
+        try:
+            with self._locked() if builds_index else nullcontext(), self._index_lock:
+                yield
+        finally:
+            self._query_state.active = False
+
+    @contextmanager
+    def _locked(self, skus: Optional[Iterable[str]] = None):
+        if skus is None:
+            stripes = range(len(self._stripes))
+        else:
+            stripes = sorted({hash(sku) % len(self._stripes) for sku in skus})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._stripes[stripe])
+            yield
+
+    def _on_add(self, product: Product):
+        with self._index_lock:
+            super()._on_add(product)
+
+    def _on_remove(self, product: Product):
+        with self._index_lock:
+            super()._on_remove(product)
+
+    def _on_quantity_change(self, product: Product, old_quantity: int):
+        with self._index_lock:
+            super()._on_quantity_change(product, old_quantity)
+
+    def _on_reload(self):
+        with self._index_lock:
+            super()._on_reload()
+
+    def _compact_if_due(self):
+        # Inventory calls this with a stripe held; see the mutations below.
+        pass
+
+    def checkpoint(self):
+        # The snapshot walks every product, so no other thread may be inserting.
+        with self._locked():
+            super().checkpoint()
+
+    def add_product(self, product: Product):
+        with self._stripe(product.sku), self._index_lock:
+            super().add_product(product)
+        super()._compact_if_due()
+
+    def adjust_product_stock(self, sku: str, amount: int):
+        with self._stripe(sku):
+            super().adjust_product_stock(sku, amount)
+        super()._compact_if_due()
+
+    def delete_product(self, sku: str):
+        with self._stripe(sku), self._index_lock:
+            super().delete_product(sku)
+        super()._compact_if_due()
+
+    def apply_adjustments(self, lines: Iterable[Tuple[str, int]],
+                          line_numbers: Optional[Sequence[int]] = None) -> BatchReport:
+        lines = list(lines)
+        with self._locked(sku for sku, _ in lines):
+            report = super().apply_adjustments(lines, line_numbers)
+        super()._compact_if_due()
+        return report
+
+    def _swap_products(self, staged):
+        # File, snapshot and multi-file loads parse into a staged store before
+        # any stripe is taken; only the swap and the index rebuild hold them.
+        with self._locked(), self._index_lock:
+            super()._swap_products(staged)
+
+    def get_low_stock_products(self) -> List[Product]:
+        with self._index_lock:
+            return super().get_low_stock_products()
+
+    def get_critical_stock_products(self) -> List[Product]:
+        with self._index_lock:
+            return super().get_critical_stock_products()
+
+    def low_stock_count(self) -> int:
+        with self._index_lock:
+            return super().low_stock_count()
+
+    def critical_stock_count(self) -> int:
+        with self._index_lock:
+            return super().critical_stock_count()
+
+    def search_skus(self, query: str, mode: str = "substring") -> Set[str]:
+        with self._querying(self._search_index is None):
+            return set(super().search_skus(query, mode))
+
+    def search_products(self, query: str, mode: str = "substring") -> List[Product]:
+        with self._querying(self._search_index is None):
+            return super().search_products(query, mode)
+
+    def sorted_products(self, field: str, reverse: bool = False,
+                        skus: Optional[Collection[str]] = None) -> List[Product]:
+        with self._querying(field not in self._sort_indexes):
+            return super().sorted_products(field, reverse, skus)
+
+    def select_products(self, query: Optional[str] = None, sort_field: Optional[str] = None,
+                        reverse: bool = False) -> Sequence[Product]:
+        # One lock for the search and the sort, so both see the same catalogue.
+        builds_index = bool(query) and self._search_index is None or \
+            bool(sort_field) and sort_field not in self._sort_indexes
+        with self._querying(builds_index):
+            return super().select_products(query, sort_field, reverse)
+
+    def _suppliers_stale(self) -> bool:
+        index = self._supplier_index
+        return index is None or index.low_stock_threshold != self.LOW_STOCK_THRESHOLD
+
+    def get_supplier_products(self, supplier_id: str) -> List[Product]:
+        with self._querying(self._suppliers_stale()):
+            return super().get_supplier_products(supplier_id)
+
+    def supplier_summaries(self) -> List[SupplierSummary]:
+        with self._querying(self._suppliers_stale()):
+            return super().supplier_summaries()
+
+    def low_stock_by_supplier(self) -> Dict[str, List[Product]]:
+        with self._querying(self._suppliers_stale()):
+            return super().low_stock_by_supplier()
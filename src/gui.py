@@ -1,16 +1,243 @@
 import customtkinter as ctk
+import functools
+import queue
+import threading
+import time
 import tkinter.filedialog as filedialog
 import tkinter.messagebox as messagebox
+from src.batch import parse_adjustment_lines
 from src.inventory import Inventory, Product
+from src.metrics import METRICS, timed
+from src.reports import build_purchase_orders, write_purchase_orders
 from PIL import Image
 
+ICON_PATH = "assets/"
+
+@functools.lru_cache(maxsize=None)
+def load_icon_image(name):
+    # Decoded once per process; every App wraps the cached image in its own CTkImage.
+    image = Image.open(f"{ICON_PATH}{name}_icon.png")
+    image.load()
+    return image
+
+class RefreshScheduler:
+    """Debounces refresh requests and runs ``compute`` on a worker thread.
+
+    Only the newest request matters: older pending requests are dropped, a
+    running computation can poll ``is_stale`` to give up early, and results from
+    superseded requests are discarded. ``apply`` always runs on the Tk thread.
+    """
+
+    POLL_MS = 15
+
+    def __init__(self, widget, compute, apply):
+        self.widget = widget
+        self.compute = compute
+        self.apply = apply
+        self.generation = 0
+        self.delivered = 0
+        self.pending_after = None
+        self.scheduled_at = 0.0
+        self.polling = False
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.worker = threading.Thread(target=self.run_worker, daemon=True)
+        self.worker.start()
+
+    def schedule(self, delay_ms, *args):
+        self.generation += 1
+        if METRICS.enabled:
+            METRICS.count("gui.refresh.requests")
+            self.scheduled_at = time.perf_counter()
+        if self.pending_after is not None:
+            self.widget.after_cancel(self.pending_after)
+        self.pending_after = self.widget.after(delay_ms, self.submit, self.generation, args)
+
+    def submit(self, generation, args):
+        self.pending_after = None
+        self.requests.put((generation, args))
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.POLL_MS, self.poll)
+
+    def is_stale(self, generation):
+        return generation != self.generation
+
+    def run_worker(self):
+        while True:
+            generation, args = self.requests.get()
+            if self.is_stale(generation):
+                continue
+            try:
+                result = self.compute(*args, is_stale=lambda: self.is_stale(generation))
+            except Exception as e:
+                result = e
+            self.results.put((generation, args, result))
+
+    def poll(self):
+        while not self.results.empty():
+            generation, args, result = self.results.get()
+            if self.is_stale(generation):
+                continue
+            self.delivered = generation
+            if isinstance(result, Exception):
+                messagebox.showerror("Error", f"Failed to refresh table: {result}")
+            else:
+                self.apply(result)
+                if METRICS.enabled:
+                    METRICS.observe("gui.refresh.latency", time.perf_counter() - self.scheduled_at)
+
+        # A pending debounce restarts polling when it submits.
+        if self.delivered == self.generation or self.pending_after is not None:
+            self.polling = False
+        else:
+            self.widget.after(self.POLL_MS, self.poll)
+
+class ProductTable(ctk.CTkFrame):
+    HEADERS = ["SKU", "Name", "Quantity", "Supplier ID"]
+    ROW_HEIGHT = 32
+
+    def __init__(self, master, inventory, on_sort, on_quantity_click):
+        super().__init__(master)
+        self.inventory = inventory
+        self.on_quantity_click = on_quantity_click
+        self.products = []
+        self.offset = 0
+        self.rows = []
+        self.editor = None
+
+        self.header_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.header_frame.grid(row=0, column=0, sticky="ew")
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.header_buttons = []
+        for i, header_text in enumerate(self.HEADERS):
+            header_button = ctk.CTkButton(self.header_frame, text=header_text,
+                                          command=lambda col=header_text: on_sort(col),
+                                          fg_color=("gray75", "gray25"),
+                                          hover_color=("gray70", "gray30"))
+            header_button.grid(row=0, column=i, padx=10, pady=5, sticky="ew")
+            self.header_buttons.append(header_button)
+            self.header_frame.grid_columnconfigure(i, weight=1, uniform="column")
+            self.body.grid_columnconfigure(i, weight=1, uniform="column")
+
+        self.body.bind("<Configure>", self.on_resize)
+        self.bind("<Enter>", self.bind_mousewheel)
+        self.bind("<Leave>", self.unbind_mousewheel)
+
+    # The body only ever holds enough rows to fill the viewport; scrolling
+    # rebinds them to a different slice of self.products.
+    def on_resize(self, event):
+        visible_rows = max(1, event.height // self.ROW_HEIGHT)
+        while len(self.rows) < visible_rows:
+            self.rows.append(self.create_row(len(self.rows)))
+        while len(self.rows) > visible_rows:
+            for label in self.rows.pop():
+                label.destroy()
+        self.render()
+
+    def create_row(self, slot):
+        METRICS.count("gui.table.widgets_created", len(self.HEADERS))
+        labels = []
+        for column in range(len(self.HEADERS)):
+            label = ctk.CTkLabel(self.body, text="", fg_color="transparent")
+            label.grid(row=slot, column=column, padx=10, pady=2, sticky="ew")
+            labels.append(label)
+        labels[2].bind("<Button-1>", lambda event, slot=slot: self.on_quantity_slot_click(event, slot))
+        return labels
+
+    def on_quantity_slot_click(self, event, slot):
+        index = self.offset + slot
+        if index < len(self.products):
+            self.on_quantity_click(event, slot, 2, self.products[index].sku)
+
+    def set_products(self, products):
+        self.products = products
+        self.offset = min(self.offset, self.max_offset())
+        self.render()
+
+    def max_offset(self):
+        return max(0, len(self.products) - len(self.rows))
+
+    def scroll_to(self, offset):
+        offset = max(0, min(int(offset), self.max_offset()))
+        if offset != self.offset:
+            if self.editor is not None and self.editor.winfo_exists():
+                # Commit an open quantity editor before its row is rebound to another product.
+                self.focus_set()
+            self.offset = offset
+            self.render()
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.products)))
+        elif args[0] == "scroll":
+            step = int(args[1]) * (len(self.rows) if args[2] == "pages" else 1)
+            self.scroll_to(self.offset + step)
+
+    def bind_mousewheel(self, event=None):
+        self.bind_all("<MouseWheel>", self.on_mousewheel)
+        self.bind_all("<Button-4>", lambda event: self.scroll_to(self.offset - 3))
+        self.bind_all("<Button-5>", lambda event: self.scroll_to(self.offset + 3))
+
+    def unbind_mousewheel(self, event=None):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.unbind_all(sequence)
+
+    def on_mousewheel(self, event):
+        self.scroll_to(self.offset - 3 * (1 if event.delta > 0 else -1))
+
+    @timed("gui.table.render")
+    def render(self):
+        METRICS.gauge("gui.table.widgets_updated", len(self.rows) * len(self.HEADERS))
+        METRICS.gauge("gui.table.rows", len(self.products))
+        for slot, labels in enumerate(self.rows):
+            index = self.offset + slot
+            if index >= len(self.products):
+                for label in labels:
+                    label.configure(text="", fg_color="transparent")
+                continue
+
+            product = self.products[index]
+            bg_color = ("#F0F0F0", "#303030") if index % 2 == 0 else ("white", "gray15")
+            sku_label, name_label, quantity_label, supplier_label = labels
+            sku_label.configure(text=product.sku, fg_color=bg_color)
+            name_label.configure(text=product.name, fg_color=bg_color)
+            supplier_label.configure(text=product.supplier_id, fg_color=bg_color)
+
+            if product.quantity <= self.inventory.LOW_STOCK_THRESHOLD:
+                if product.quantity <= self.inventory.CRITICAL_STOCK_THRESHOLD:
+                    quantity_label.configure(text=f"{product.quantity} 🚨", text_color="orange", fg_color=bg_color)
+                else:
+                    quantity_label.configure(text=f"{product.quantity} ⚠️", text_color="red", fg_color=bg_color)
+            else:
+                quantity_label.configure(text=str(product.quantity), text_color=sku_label.cget("text_color"), fg_color=bg_color)
+
+        if self.products:
+            first = self.offset / len(self.products)
+            last = min(1.0, (self.offset + len(self.rows)) / len(self.products))
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+
 class App(ctk.CTk):
-    def __init__(self, inventory):
+    SEARCH_DEBOUNCE_MS = 150
+    METRICS_READOUT_MS = 1000
+    FILE_CHUNKSIZE = 50_000
+    SORT_FIELDS = {"SKU": "sku", "Name": "name", "Quantity": "quantity", "Supplier ID": "supplier_id"}
+
+    def __init__(self, inventory, loader=None):
         super().__init__()
         
         self.inventory = inventory
         self.current_sort_column = None
         self.sort_ascending = True
+        self.refresh_scheduler = RefreshScheduler(self, self.compute_table_rows, self.apply_table_rows)
 
         self.title("Simple Inventory System")
         self.geometry("1151x601")
@@ -24,24 +251,77 @@ class App(ctk.CTk):
         self.search_frame = ctk.CTkFrame(self)
         self.search_frame.pack(fill="x", padx=10, pady=5)
 
-        self.table_scroll_frame = ctk.CTkScrollableFrame(self)
-        self.table_scroll_frame.pack(fill="both", expand=True, padx=10, pady=5)
-
         self.setup_icons()
         self.setup_dashboard()
         self.setup_buttons()
         self.setup_search_bar()
         self.create_product_table()
         self.refresh_table()
+
+        # Icons and the initial data load wait until the first frame has been drawn.
+        self.after_idle(self.load_icons)
+        if loader is not None:
+            self.start_loading(loader)
         
     def setup_icons(self):
-        icon_path = "assets/"
-        self.add_icon = ctk.CTkImage(Image.open(f"{icon_path}add_icon.png"), size=(20, 20))
-        self.delete_icon = ctk.CTkImage(Image.open(f"{icon_path}delete_icon.png"), size=(20, 20))
-        self.save_icon = ctk.CTkImage(Image.open(f"{icon_path}save_icon.png"), size=(20, 20))
-        self.open_icon = ctk.CTkImage(Image.open(f"{icon_path}open_icon.png"), size=(20, 20))
-        self.adjust_icon = ctk.CTkImage(Image.open(f"{icon_path}adjust_icon.png"), size=(20, 20))
-        self.search_icon = ctk.CTkImage(Image.open(f"{icon_path}search_icon.png"), size=(20, 20))
+        self.add_icon = None
+        self.delete_icon = None
+        self.save_icon = None
+        self.open_icon = None
+        self.adjust_icon = None
+        self.search_icon = None
+
+    def load_icons(self):
+        self.add_icon = ctk.CTkImage(load_icon_image("add"), size=(20, 20))
+        self.delete_icon = ctk.CTkImage(load_icon_image("delete"), size=(20, 20))
+        self.save_icon = ctk.CTkImage(load_icon_image("save"), size=(20, 20))
+        self.open_icon = ctk.CTkImage(load_icon_image("open"), size=(20, 20))
+        self.adjust_icon = ctk.CTkImage(load_icon_image("adjust"), size=(20, 20))
+        self.search_icon = ctk.CTkImage(load_icon_image("search"), size=(20, 20))
+
+        self.add_button.configure(image=self.add_icon)
+        self.delete_product_button.configure(image=self.delete_icon)
+        self.export_button.configure(image=self.save_icon)
+        self.import_button.configure(image=self.open_icon)
+        self.adjust_stock_button.configure(image=self.adjust_icon)
+        self.search_icon_label.configure(image=self.search_icon)
+
+    def start_loading(self, loader):
+        # The loader replaces the catalogue on another thread: anything that would
+        # query or build an index (sorting included) waits until it has finished.
+        controls = [self.search_entry] + self.button_frame.winfo_children() + self.product_table.header_buttons
+        for control in controls:
+            control.configure(state="disabled")
+        self.status_label.configure(text="Loading inventory...")
+        self.progress_bar.configure(mode="indeterminate")
+        self.progress_bar.pack(side="right", padx=5, pady=5)
+        self.progress_bar.start()
+
+        outcome = queue.Queue()
+
+        def run():
+            try:
+                loader()
+                outcome.put(None)
+            except Exception as e:
+                outcome.put(e)
+
+        def check():
+            if outcome.empty():
+                self.after(50, check)
+                return
+            error = outcome.get()
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode="determinate")
+            self.hide_progress()
+            for control in controls:
+                control.configure(state="normal")
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to load inventory: {error}")
+            self.refresh_table()
+
+        self.after_idle(lambda: threading.Thread(target=run, daemon=True).start())
+        self.after(50, check)
         
     def setup_dashboard(self):
         self.total_products_label = ctk.CTkLabel(self.dashboard_frame, text="Total Products: 0", font=ctk.CTkFont(size=16, weight="bold"))
@@ -49,6 +329,56 @@ class App(ctk.CTk):
         
         self.low_stock_label = ctk.CTkLabel(self.dashboard_frame, text="Low Stock: 0", font=ctk.CTkFont(size=16, weight="bold"))
         self.low_stock_label.pack(side="left", padx=20, pady=5)
+
+        self.progress_bar = ctk.CTkProgressBar(self.dashboard_frame, width=200)
+        self.progress_bar.set(0)
+        self.status_label = ctk.CTkLabel(self.dashboard_frame, text="")
+        self.status_label.pack(side="right", padx=20, pady=5)
+
+        if METRICS.enabled:
+            self.metrics_label = ctk.CTkLabel(self.dashboard_frame, text="", font=ctk.CTkFont(family="Courier", size=12))
+            self.metrics_label.pack(side="right", padx=10, pady=5)
+            self.bind("<Control-m>", lambda event: self.export_metrics())
+            self.after(self.METRICS_READOUT_MS, self.update_metrics_readout)
+
+    def update_metrics_readout(self):
+        timers = METRICS.timers
+
+        def ms(name):
+            histogram = timers.get(name)
+            return f"{histogram.last * 1000:.1f}ms" if histogram else "-"
+
+        self.metrics_label.configure(
+            text=f"compute {ms('gui.refresh.compute')} | render {ms('gui.table.render')} | "
+                 f"refresh {ms('gui.refresh.latency')} | rows {METRICS.gauges.get('gui.table.rows', 0):,} | "
+                 f"widgets {METRICS.counters.get('gui.table.widgets_created', 0)} (Ctrl+M saves)")
+        self.after(self.METRICS_READOUT_MS, self.update_metrics_readout)
+
+    def export_metrics(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Metrics", "*.json *.prom")],
+            title="Save Metrics"
+        )
+        if file_path:
+            METRICS.write(file_path)
+
+    def file_progress(self, verb):
+        self.progress_bar.set(0)
+        self.progress_bar.pack(side="right", padx=5, pady=5)
+
+        def progress(done, total):
+            if total:
+                self.progress_bar.set(min(1.0, done / total))
+                self.status_label.configure(text=f"{verb} {done:,} of {total:,} rows...")
+            else:
+                self.status_label.configure(text=f"{verb} {done:,} rows...")
+            self.update_idletasks()
+        return progress
+
+    def hide_progress(self):
+        self.progress_bar.pack_forget()
+        self.status_label.configure(text="")
         
     def setup_buttons(self):
         self.add_button = ctk.CTkButton(self.button_frame, text="Add Product", command=self.add_product_dialog, fg_color="green", hover_color="darkgreen", image=self.add_icon)
@@ -65,6 +395,9 @@ class App(ctk.CTk):
         
         self.view_all_products_button = ctk.CTkButton(self.button_frame, text="View All Products", command=self.refresh_table)
         self.view_all_products_button.pack(side="left", padx=5, pady=5)
+
+        self.reorder_button = ctk.CTkButton(self.button_frame, text="Purchase Orders", command=self.export_purchase_orders)
+        self.reorder_button.pack(side="left", padx=5, pady=5)
         
         self.import_button = ctk.CTkButton(self.button_frame, text="Open File", command=self.import_from_file, image=self.open_icon)
         self.import_button.pack(side="right", padx=5, pady=5)
@@ -72,6 +405,9 @@ class App(ctk.CTk):
         self.export_button = ctk.CTkButton(self.button_frame, text="Save File", command=self.export_to_file, image=self.save_icon)
         self.export_button.pack(side="right", padx=5, pady=5)
 
+        self.reconcile_button = ctk.CTkButton(self.button_frame, text="Reconcile Count", command=self.reconcile_from_file)
+        self.reconcile_button.pack(side="right", padx=5, pady=5)
+
     def setup_search_bar(self):
         self.search_label = ctk.CTkLabel(self.search_frame, text="Search:")
         self.search_label.pack(side="left", padx=5, pady=5)
@@ -89,17 +425,11 @@ class App(ctk.CTk):
     
     def search_products(self, event=None):
         query = self.search_entry.get().lower()
-        self.refresh_table(search_query=query)
+        self.refresh_table(search_query=query, delay_ms=self.SEARCH_DEBOUNCE_MS)
 
     def create_product_table(self):
-        headers = ["SKU", "Name", "Quantity", "Supplier ID"]
-        for i, header_text in enumerate(headers):
-            header_button = ctk.CTkButton(self.table_scroll_frame, text=header_text, 
-                                          command=lambda col=header_text: self.sort_table(col),
-                                          fg_color=("gray75", "gray25"),
-                                          hover_color=("gray70", "gray30"))
-            header_button.grid(row=0, column=i, padx=10, pady=5, sticky="ew")
-            self.table_scroll_frame.grid_columnconfigure(i, weight=1)
+        self.product_table = ProductTable(self, self.inventory, self.sort_table, self.on_quantity_click)
+        self.product_table.pack(fill="both", expand=True, padx=10, pady=5)
 
     def sort_table(self, column):
         if self.current_sort_column == column:
@@ -110,65 +440,48 @@ class App(ctk.CTk):
 
         self.refresh_table()
 
-    def refresh_table(self, products=None, search_query=None):
-        for widget in self.table_scroll_frame.winfo_children():
-            if widget.grid_info()["row"] > 0:
-                widget.destroy()
+    def refresh_table(self, products=None, search_query=None, delay_ms=0):
+        self.refresh_scheduler.schedule(delay_ms, products, search_query,
+                                        self.current_sort_column, self.sort_ascending)
 
+        self.total_products_label.configure(text=f"Total Products: {len(self.inventory.products)}")
+        low_stock_count = self.inventory.low_stock_count()
+        self.low_stock_label.configure(text=f"Low Stock: {low_stock_count}")
+
+    # Runs on the refresh worker thread; must not touch any widget. The inventory
+    # is queried from here while the Tk thread changes it, so it has to be one
+    # whose queries are thread-safe (main() uses a ConcurrentInventory).
+    @timed("gui.refresh.compute", rows=len)
+    def compute_table_rows(self, products, search_query, sort_column, ascending, is_stale):
         if products is None:
-            products = self.inventory.list_all_products()
+            # Whole-catalog views come from the inventory's own indexes (or database).
+            return self.inventory.select_products(search_query, self.SORT_FIELDS.get(sort_column), reverse=not ascending)
 
         if search_query:
             products = [p for p in products if search_query in p.sku.lower() or search_query in p.name.lower()]
+        if sort_column and not is_stale():
+            products.sort(key=lambda p: getattr(p, self.SORT_FIELDS[sort_column]), reverse=not ascending)
+        return products
 
-        if self.current_sort_column:
-            sort_key_map = {
-                "SKU": lambda p: p.sku,
-                "Name": lambda p: p.name,
-                "Quantity": lambda p: p.quantity,
-                "Supplier ID": lambda p: p.supplier_id
-            }
-            products.sort(key=sort_key_map[self.current_sort_column], reverse=not self.sort_ascending)
-
-        for i, product in enumerate(products):
-            bg_color = ("#F0F0F0", "#303030") if i % 2 == 0 else ("white", "gray15")
-            
-            sku_label = ctk.CTkLabel(self.table_scroll_frame, text=product.sku, fg_color=bg_color)
-            sku_label.grid(row=i+1, column=0, padx=10, pady=2, sticky="ew")
-
-            name_label = ctk.CTkLabel(self.table_scroll_frame, text=product.name, fg_color=bg_color)
-            name_label.grid(row=i+1, column=1, padx=10, pady=2, sticky="ew")
-
-            if product.quantity <= self.inventory.LOW_STOCK_THRESHOLD:
-                if product.quantity <= self.inventory.CRITICAL_STOCK_THRESHOLD:
-                    quantity_label = ctk.CTkLabel(self.table_scroll_frame, text=f"{product.quantity} 🚨", text_color="orange", fg_color=bg_color)
-                else:
-                    quantity_label = ctk.CTkLabel(self.table_scroll_frame, text=f"{product.quantity} ⚠️", text_color="red", fg_color=bg_color)
-            else:
-                quantity_label = ctk.CTkLabel(self.table_scroll_frame, text=str(product.quantity), fg_color=bg_color)
-            
-            quantity_label.grid(row=i+1, column=2, padx=10, pady=2, sticky="ew")
-            quantity_label.bind("<Button-1>", lambda event, row=i+1, col=2, sku=product.sku: self.on_quantity_click(event, row, col, sku))
-            
-            supplier_label = ctk.CTkLabel(self.table_scroll_frame, text=product.supplier_id, fg_color=bg_color)
-            supplier_label.grid(row=i+1, column=3, padx=10, pady=2, sticky="ew")
-
-        self.total_products_label.configure(text=f"Total Products: {len(self.inventory.products)}")
-        low_stock_count = len(self.inventory.get_low_stock_products())
-        self.low_stock_label.configure(text=f"Low Stock: {low_stock_count}")
+    def apply_table_rows(self, products):
+        self.product_table.set_products(products)
             
     def on_quantity_click(self, event, row, col, sku):
-        label_to_replace = event.widget
-        current_quantity = int(label_to_replace.cget("text").split()[0])
+        current_quantity = self.inventory.products[sku].quantity
         
-        entry = ctk.CTkEntry(self.table_scroll_frame, width=50)
+        entry = ctk.CTkEntry(self.product_table.body, width=50)
         entry.insert(0, str(current_quantity))
         entry.grid(row=row, column=col, padx=10, pady=2)
         entry.focus_set()
+        self.product_table.editor = entry
         
         def save_and_refresh(event=None):
+            if not entry.winfo_exists():
+                return
+            new_text = entry.get()
+            entry.destroy()
             try:
-                new_quantity = int(entry.get())
+                new_quantity = int(new_text)
                 current_quantity = self.inventory.products[sku].quantity
                 amount = new_quantity - current_quantity
                 self.inventory.adjust_product_stock(sku, amount)
@@ -197,11 +510,14 @@ class App(ctk.CTk):
             return
             
         try:
-            self.inventory.load_from_file(file_path)
+            self.inventory.load_from_file(file_path, chunksize=self.FILE_CHUNKSIZE,
+                                          progress=self.file_progress("Imported"))
             self.refresh_table()
             messagebox.showinfo("Success", "Inventory data imported successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import data: {e}")
+        finally:
+            self.hide_progress()
 
     def export_to_file(self):
         file_path = filedialog.asksaveasfilename(
@@ -213,10 +529,50 @@ class App(ctk.CTk):
             return
             
         try:
-            self.inventory.save_to_file(file_path)
+            self.inventory.save_to_file(file_path, progress=self.file_progress("Saved"))
             messagebox.showinfo("Success", "Inventory data exported successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export data: {e}")
+        finally:
+            self.hide_progress()
+
+    def reconcile_from_file(self):
+        file_path = filedialog.askopenfilename(
+            defaultextension=".csv",
+            filetypes=[("Spreadsheet Files", "*.csv *.xlsx")],
+            title="Select Stock Count File"
+        )
+        if not file_path:
+            return
+
+        try:
+            result = self.inventory.reconcile(file_path, chunksize=self.FILE_CHUNKSIZE,
+                                              progress=self.file_progress("Compared"))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to compare count file: {e}")
+            return
+        finally:
+            self.hide_progress()
+        ReconcileDialog(self, self.inventory, result, self.refresh_table)
+
+    def export_purchase_orders(self):
+        orders = build_purchase_orders(self.inventory)
+        if not orders:
+            messagebox.showinfo("Purchase Orders", "No products are low on stock.")
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("Spreadsheet Files", "*.csv *.xlsx")],
+            title="Save Purchase Orders"
+        )
+        if not file_path:
+            return
+
+        try:
+            lines = write_purchase_orders(file_path, orders)
+            messagebox.showinfo("Success", f"Saved {len(orders)} purchase order(s) covering {lines} product(s).")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export purchase orders: {e}")
 
     def add_product_dialog(self):
         AddProductDialog(self, self.inventory, self.refresh_table)
@@ -291,20 +647,45 @@ class AdjustStockDialog(ctk.CTkToplevel):
         self.callback = callback
         
         self.title("Adjust Product Stock")
-        self.geometry("300x200")
+        self.geometry("300x240")
 
         self.transient(master)
         self.grab_set()
 
-        ctk.CTkLabel(self, text="SKU").pack(padx=10, pady=5)
-        self.sku_entry = ctk.CTkEntry(self)
+        self.mode_switch = ctk.CTkSegmentedButton(self, values=["Single", "Bulk"], command=self.switch_mode)
+        self.mode_switch.set("Single")
+        self.mode_switch.pack(padx=10, pady=5)
+
+        self.single_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.single_frame.pack(fill="both", expand=True)
+
+        ctk.CTkLabel(self.single_frame, text="SKU").pack(padx=10, pady=5)
+        self.sku_entry = ctk.CTkEntry(self.single_frame)
         self.sku_entry.pack(padx=10, pady=2)
         
-        ctk.CTkLabel(self, text="Amount to Add/Subtract").pack(padx=10, pady=5)
-        self.amount_entry = ctk.CTkEntry(self)
+        ctk.CTkLabel(self.single_frame, text="Amount to Add/Subtract").pack(padx=10, pady=5)
+        self.amount_entry = ctk.CTkEntry(self.single_frame)
         self.amount_entry.pack(padx=10, pady=2)
 
-        ctk.CTkButton(self, text="Adjust Stock", command=self.adjust_stock).pack(padx=10, pady=10)
+        ctk.CTkButton(self.single_frame, text="Adjust Stock", command=self.adjust_stock).pack(padx=10, pady=10)
+
+        self.bulk_frame = ctk.CTkFrame(self, fg_color="transparent")
+
+        ctk.CTkLabel(self.bulk_frame, text="One 'SKU, amount' per line").pack(padx=10, pady=5)
+        self.lines_textbox = ctk.CTkTextbox(self.bulk_frame, height=220)
+        self.lines_textbox.pack(fill="both", expand=True, padx=10, pady=2)
+
+        ctk.CTkButton(self.bulk_frame, text="Apply All", command=self.adjust_stock_bulk).pack(padx=10, pady=10)
+
+    def switch_mode(self, mode):
+        if mode == "Bulk":
+            self.single_frame.pack_forget()
+            self.bulk_frame.pack(fill="both", expand=True)
+            self.geometry("300x380")
+        else:
+            self.bulk_frame.pack_forget()
+            self.single_frame.pack(fill="both", expand=True)
+            self.geometry("300x240")
     
     def adjust_stock(self):
         try:
@@ -326,6 +707,26 @@ class AdjustStockDialog(ctk.CTkToplevel):
             import tkinter.messagebox as messagebox
             messagebox.showerror("Error", f"An unexpected error occurred: {e}")
 
+    def adjust_stock_bulk(self):
+        try:
+            lines, line_numbers = parse_adjustment_lines(self.lines_textbox.get("1.0", "end"))
+            if not lines:
+                raise ValueError("Enter at least one line.")
+
+            report = self.inventory.apply_adjustments(lines, line_numbers)
+            if not report.applied:
+                messagebox.showerror("Adjustment Failed", report.summary())
+                return
+
+            self.destroy()
+            self.callback()
+            messagebox.showinfo("Success", report.summary())
+
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid input: {e}")
+        except Exception as e:
+            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+
 class DeleteProductDialog(ctk.CTkToplevel):
     def __init__(self, master, inventory, callback):
         super().__init__(master)
@@ -360,4 +761,49 @@ class DeleteProductDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", f"Deletion failed: {e}")
         except Exception as e:
             import tkinter.messagebox as messagebox
-            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
\ No newline at end of file
+            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+
+class ReconcileDialog(ctk.CTkToplevel):
+    def __init__(self, master, inventory, result, callback):
+        super().__init__(master)
+        self.inventory = inventory
+        self.result = result
+        self.callback = callback
+
+        self.title("Reconcile Stock Count")
+        self.geometry("520x420")
+
+        self.transient(master)
+        self.grab_set()
+
+        summary = ctk.CTkTextbox(self, height=260)
+        summary.insert("1.0", result.summary(limit=50))
+        summary.configure(state="disabled")
+        summary.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.zero_missing = ctk.CTkCheckBox(self, text="Set products missing from the count to zero")
+        self.zero_missing.pack(padx=10, pady=5)
+
+        buttons = ctk.CTkFrame(self, fg_color="transparent")
+        buttons.pack(padx=10, pady=10)
+        ctk.CTkButton(buttons, text="Show Changed", command=self.show_changed).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Apply Count", command=self.apply_count,
+                      state="disabled" if result.in_sync else "normal").pack(side="left", padx=5)
+
+    def show_changed(self):
+        products = self.inventory.products
+        self.callback(products=[products[change.sku] for change in self.result.changed if change.sku in products])
+
+    def apply_count(self):
+        lines = self.result.adjustments(zero_missing=bool(self.zero_missing.get()))
+        if not lines:
+            messagebox.showinfo("Reconcile", "No quantities to change.")
+            return
+        report = self.inventory.apply_adjustments(lines)
+        if not report.applied:
+            messagebox.showerror("Reconcile Failed", report.summary())
+            return
+
+        self.destroy()
+        self.callback()
+        messagebox.showinfo("Success", report.summary())
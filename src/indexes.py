@@ -0,0 +1,294 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class QuantityIndex:
+    """Buckets SKUs by quantity, with the distinct quantities kept sorted.
+
+    Stock levels cluster heavily, so "everything at or below N" is a walk over a
+    handful of buckets rather than a scan of every product, and any threshold can
+    be asked for without re-bucketing.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, Set[str]] = {}
+        self._quantities: List[int] = []
+
+    def rebuild(self, products: Iterable):
+        self._buckets.clear()
+        self._quantities.clear()
+        for product in products:
+            self._buckets.setdefault(product.quantity, set()).add(product.sku)
+        self._quantities.extend(sorted(self._buckets))
+
+    def add(self, product):
+        self._insert(product.sku, product.quantity)
+
+    def remove(self, product):
+        self._discard(product.sku, product.quantity)
+
+    def update_quantity(self, product, old_quantity: int):
+        if old_quantity != product.quantity:
+            self._discard(product.sku, old_quantity)
+            self._insert(product.sku, product.quantity)
+
+    def _insert(self, sku: str, quantity: int):
+        bucket = self._buckets.get(quantity)
+        if bucket is None:
+            bucket = self._buckets[quantity] = set()
+            insort(self._quantities, quantity)
+        bucket.add(sku)
+
+    def _discard(self, sku: str, quantity: int):
+        bucket = self._buckets.get(quantity)
+        if bucket is None:
+            return
+        bucket.discard(sku)
+        if not bucket:
+            del self._buckets[quantity]
+            del self._quantities[bisect_left(self._quantities, quantity)]
+
+    def skus_at_most(self, threshold: int) -> Iterator[str]:
+        for quantity in self._quantities[:bisect_right(self._quantities, threshold)]:
+            yield from self._buckets[quantity]
+
+    def count_at_most(self, threshold: int) -> int:
+        end = bisect_right(self._quantities, threshold)
+        return sum(len(self._buckets[quantity]) for quantity in self._quantities[:end])
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _iter_from(sorted_items: list, key) -> Iterator:
+    for i in range(bisect_left(sorted_items, key), len(sorted_items)):
+        yield sorted_items[i]
+
+
+class SearchIndex:
+    """Lowercased trigram postings over SKUs and names, plus sorted SKU and name-token lists.
+
+    ``search`` keeps the result of the previous query; while the user keeps
+    typing (each query contains the last one) new results are filtered from it
+    instead of going back to the postings. The cached result is tagged with
+    ``_version``, which every change bumps, so a result computed while the index
+    was being changed is never reused.
+    """
+
+    MODES = ("substring", "prefix", "token")
+
+    def __init__(self):
+        self._text: Dict[str, Tuple[str, str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._sorted_skus: List[Tuple[str, str]] = []
+        self._tokens: Dict[str, Set[str]] = {}
+        self._sorted_tokens: List[str] = []
+        self._last = None
+        self._version = 0
+
+    def rebuild(self, products: Iterable):
+        self._text.clear()
+        self._postings.clear()
+        self._tokens.clear()
+        self._version += 1
+        for product in products:
+            self._index(product.sku, product.name)
+        self._sorted_skus = sorted((sku_lower, sku) for sku, (sku_lower, _) in self._text.items())
+        self._sorted_tokens = sorted(self._tokens)
+
+    def add(self, product):
+        self._index(product.sku, product.name)
+        insort(self._sorted_skus, (product.sku.lower(), product.sku))
+        for token in set(self._text[product.sku][1].split()):
+            if len(self._tokens[token]) == 1:
+                insort(self._sorted_tokens, token)
+        self._version += 1
+
+    def remove(self, product):
+        sku_lower, name_lower = self._text.pop(product.sku)
+        for trigram in _trigrams(sku_lower) | _trigrams(name_lower):
+            postings = self._postings[trigram]
+            postings.discard(product.sku)
+            if not postings:
+                del self._postings[trigram]
+        for token in set(name_lower.split()):
+            skus = self._tokens[token]
+            skus.discard(product.sku)
+            if not skus:
+                del self._tokens[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+        del self._sorted_skus[bisect_left(self._sorted_skus, (sku_lower, product.sku))]
+        self._version += 1
+
+    def update_quantity(self, product, old_quantity: int):
+        pass
+
+    def _index(self, sku: str, name: str):
+        sku_lower, name_lower = sku.lower(), name.lower()
+        self._text[sku] = (sku_lower, name_lower)
+        for trigram in _trigrams(sku_lower) | _trigrams(name_lower):
+            self._postings.setdefault(trigram, set()).add(sku)
+        for token in name_lower.split():
+            self._tokens.setdefault(token, set()).add(sku)
+
+    def search(self, query: str, mode: str = "substring") -> Set[str]:
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown search mode '{mode}'. Expected one of: {', '.join(self.MODES)}")
+        query = query.lower().strip()
+        if not query:
+            return set(self._text)
+
+        if mode == "prefix":
+            matches = set()
+            for sku_lower, sku in _iter_from(self._sorted_skus, (query,)):
+                if not sku_lower.startswith(query):
+                    break
+                matches.add(sku)
+            return matches
+        if mode == "token":
+            # Every query word must be the start of some word in the name.
+            matches = None
+            for word in query.split():
+                skus = set()
+                for token in _iter_from(self._sorted_tokens, word):
+                    if not token.startswith(word):
+                        break
+                    skus |= self._tokens[token]
+                matches = skus if matches is None else matches & skus
+            return matches
+
+        version, last = self._version, self._last
+        if last is not None and last[0] == version and last[1] in query:
+            candidates = last[2]
+        elif len(query) >= 3:
+            postings = sorted((self._postings.get(t, set()) for t in _trigrams(query)), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = self._text.keys()
+        text = self._text
+        matches = {sku for sku in candidates if query in text[sku][0] or query in text[sku][1]}
+        self._last = (version, query, matches)
+        return matches
+
+
+class SortIndex:
+    """Keeps (value, sku) pairs for one product field in sorted order."""
+
+    def __init__(self, field: str):
+        self.field = field
+        self._entries: List[tuple] = []
+
+    def rebuild(self, products: Iterable):
+        self._entries = sorted((getattr(product, self.field), product.sku) for product in products)
+
+    def add(self, product):
+        insort(self._entries, (getattr(product, self.field), product.sku))
+
+    def remove(self, product):
+        self._discard((getattr(product, self.field), product.sku))
+
+    def update_quantity(self, product, old_quantity: int):
+        if self.field == "quantity" and old_quantity != product.quantity:
+            self._discard((old_quantity, product.sku))
+            insort(self._entries, (product.quantity, product.sku))
+
+    def _discard(self, entry: tuple):
+        position = bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+    def skus(self, reverse: bool = False) -> Iterator[str]:
+        # A copy, so a caller that consumes this lazily never walks a list insort/del is changing.
+        entries = self._entries[::-1] if reverse else self._entries[:]
+        for _, sku in entries:
+            yield sku
+
+
+class SupplierTotals:
+    __slots__ = ("products", "units", "low_stock")
+
+    def __init__(self):
+        self.products = 0
+        self.units = 0
+        self.low_stock = 0
+
+
+class SupplierIndex:
+    """Supplier -> SKUs, plus running per-supplier totals and low-stock SKU sets.
+
+    Every mutation adjusts the totals of the one supplier it touches, so
+    per-supplier summaries cost O(suppliers) and the reorder report
+    O(suppliers + low-stock products), however large the catalogue is.
+    """
+
+    def __init__(self, low_stock_threshold: int):
+        self.low_stock_threshold = low_stock_threshold
+        self._skus: Dict[str, Set[str]] = {}
+        self._low_stock: Dict[str, Set[str]] = {}
+        self._totals: Dict[str, SupplierTotals] = {}
+
+    def rebuild(self, products: Iterable):
+        self._skus.clear()
+        self._low_stock.clear()
+        self._totals.clear()
+        for product in products:
+            self.add(product)
+
+    def add(self, product):
+        supplier_id = product.supplier_id
+        self._skus.setdefault(supplier_id, set()).add(product.sku)
+        totals = self._totals.get(supplier_id)
+        if totals is None:
+            totals = self._totals[supplier_id] = SupplierTotals()
+        totals.products += 1
+        totals.units += product.quantity
+        if product.quantity <= self.low_stock_threshold:
+            self._low_stock.setdefault(supplier_id, set()).add(product.sku)
+            totals.low_stock += 1
+
+    def remove(self, product):
+        supplier_id = product.supplier_id
+        skus = self._skus.get(supplier_id)
+        if skus is None or product.sku not in skus:
+            return
+        skus.discard(product.sku)
+        totals = self._totals[supplier_id]
+        totals.products -= 1
+        totals.units -= product.quantity
+        if product.quantity <= self.low_stock_threshold:
+            self._discard_low(supplier_id, product.sku)
+            totals.low_stock -= 1
+        if not skus:
+            del self._skus[supplier_id]
+            del self._totals[supplier_id]
+
+    def update_quantity(self, product, old_quantity: int):
+        supplier_id = product.supplier_id
+        totals = self._totals.get(supplier_id)
+        if totals is None:
+            return
+        totals.units += product.quantity - old_quantity
+        was_low = old_quantity <= self.low_stock_threshold
+        is_low = product.quantity <= self.low_stock_threshold
+        if is_low and not was_low:
+            self._low_stock.setdefault(supplier_id, set()).add(product.sku)
+            totals.low_stock += 1
+        elif was_low and not is_low:
+            self._discard_low(supplier_id, product.sku)
+            totals.low_stock -= 1
+
+    def _discard_low(self, supplier_id: str, sku: str):
+        low = self._low_stock[supplier_id]
+        low.discard(sku)
+        if not low:
+            del self._low_stock[supplier_id]
+
+    def skus(self, supplier_id: str) -> Set[str]:
+        return self._skus.get(supplier_id, set())
+
+    def totals(self) -> Iterator[Tuple[str, SupplierTotals]]:
+        return iter(self._totals.items())
+
+    def low_stock(self) -> Iterator[Tuple[str, Set[str]]]:
+        return iter(self._low_stock.items())
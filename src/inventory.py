@@ -1,9 +1,19 @@
-import pandas as pd
 import re
-from typing import List
+from contextlib import nullcontext
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from .batch import BatchReport
+from .bulk import FIRST_DATA_LINE, SKU_PATTERN, ImportValidationError, LoadReport, validate_frame
+from .indexes import QuantityIndex, SearchIndex, SortIndex, SupplierIndex
+from .journal import OP_DELETE, OP_PUT, OP_QUANTITY, read_journal
+from .metrics import timed
+from .multiload import MultiLoadReport, load_files
+from .reconcile import Reconciliation, reconcile
+from .reports import SupplierSummary
+from .snapshot import read_snapshot, write_snapshot
+from .streaming import DEFAULT_CHUNKSIZE, ProgressCallback, file_format, iter_chunks, write_products, xlsx_row_count
 
 class Product:
-    SKU_PATTERN = r"^[A-Z]{3}-\d{4}$"
+    SKU_PATTERN = SKU_PATTERN
 
     def __init__(self, sku: str, name: str, quantity: int, supplier_id: str):
         if not re.match(self.SKU_PATTERN, sku):
@@ -15,6 +25,16 @@ class Product:
         self.quantity = quantity
         self.supplier_id = supplier_id
 
+    @classmethod
+    def from_validated(cls, sku: str, name: str, quantity: int, supplier_id: str) -> "Product":
+        # Skips the per-row checks for rows the bulk loader has already validated.
+        product = cls.__new__(cls)
+        product.sku = sku
+        product.name = name
+        product.quantity = quantity
+        product.supplier_id = supplier_id
+        return product
+
     def adjust_stock(self, amount: int):
         if self.quantity + amount < 0:
             raise ValueError(f"Cannot reduce stock below zero for product {self.sku}")
@@ -37,56 +57,282 @@ class Supplier:
 class Inventory:
     LOW_STOCK_THRESHOLD = 5
     CRITICAL_STOCK_THRESHOLD = 2
+    SORTABLE_FIELDS = ("sku", "name", "quantity", "supplier_id")
 
-    def __init__(self):
-        self.products = {}
+    def __init__(self, store=None):
+        # Any mutable mapping of SKU -> Product works, e.g. columnar.ColumnarProductStore.
+        self.products = store if store is not None else {}
         self.suppliers = {}
+        self._quantity_index = QuantityIndex()
+        self._search_index = None
+        self._sort_indexes = {}
+        self._supplier_index = None
+        self._journal = None
+        self._indexes = [self._quantity_index]
+
+    def _on_add(self, product: Product):
+        for index in self._indexes:
+            index.add(product)
+
+    def _on_remove(self, product: Product):
+        for index in self._indexes:
+            index.remove(product)
+
+    def _on_quantity_change(self, product: Product, old_quantity: int):
+        for index in self._indexes:
+            index.update_quantity(product, old_quantity)
+
+    def _on_reload(self):
+        for index in self._indexes:
+            index.rebuild(self.products.values())
     
-    def load_from_file(self, filepath: str):
-        self.products.clear()
-        
-        file_extension = filepath.split('.')[-1].lower()
-        if file_extension == 'csv':
-            df = pd.read_csv(filepath)
-        elif file_extension in ['xlsx', 'xls']:
-            df = pd.read_excel(filepath)
-        else:
-            raise ValueError("Unsupported file format. Please use .csv or .xlsx")
-
-        for index, row in df.iterrows():
-            product = Product(
-                sku=row["sku"],
-                name=row["name"],
-                quantity=int(row["quantity"]),
-                supplier_id=row["supplier_id"]
-            )
-            self.products[product.sku] = product
-
-    def save_to_file(self, filepath: str):
-        fieldnames = ["sku", "name", "quantity", "supplier_id"]
-        product_list = [p.to_dict() for p in self.products.values()]
-        df = pd.DataFrame(product_list, columns=fieldnames)
-        
-        file_extension = filepath.split('.')[-1].lower()
-        if file_extension == 'csv':
-            df.to_csv(filepath, index=False)
-        elif file_extension == 'xlsx':
-            df.to_excel(filepath, index=False)
+    @timed("inventory.load", rows=lambda report: report.rows_read)
+    def load_from_file(self, filepath: str, strict: bool = True, chunksize: Optional[int] = None,
+                       progress: Optional[ProgressCallback] = None) -> LoadReport:
+        # Rows are ingested into a fresh store that only replaces the current
+        # one once the whole file has been read.
+        staged = type(self.products)()
+        report = self._ingest_file(staged, filepath, strict, chunksize, progress)
+        self._swap_products(staged)
+        return report
+
+    @timed("inventory.load_files", rows=lambda report: report.rows_read)
+    def load_from_files(self, filepaths: Iterable[str], policy: str = "sum", strict: bool = True,
+                        workers: Optional[int] = None, chunksize: Optional[int] = None,
+                        progress: Optional[ProgressCallback] = None) -> MultiLoadReport:
+        # Files are parsed and validated in a process pool, merged per ``policy``
+        # (see multiload.CONFLICT_POLICIES) and then loaded in one pass.
+        columns, report = load_files(filepaths, policy, strict, workers, chunksize, progress)
+        self._replace_products(*columns)
+        return report
+
+    def _replace_products(self, skus, names, quantities, supplier_ids):
+        staged = type(self.products)()
+        self._ingest(staged, skus, names, quantities, supplier_ids)
+        self._swap_products(staged)
+
+    def _swap_products(self, staged):
+        self.products = staged
+        self._on_reload()
+
+    def _ingest_file(self, store, filepath: str, strict: bool, chunksize: Optional[int],
+                     progress: Optional[ProgressCallback]) -> LoadReport:
+        # Validates and ingests chunk by chunk; in strict mode nothing more is
+        # ingested after the first bad row, but every chunk is still checked.
+        total = xlsx_row_count(filepath) if progress and file_format(filepath) == "xlsx" else None
+        report = LoadReport()
+        seen = set()
+        line = FIRST_DATA_LINE
+        for df in iter_chunks(filepath, chunksize):
+            valid, errors = validate_frame(df, line, seen)
+            line += len(df)
+            report.rows_read += len(df)
+            report.errors.extend(errors)
+            if not (strict and report.errors):
+                self._ingest(store, valid["sku"].tolist(), valid["name"].tolist(),
+                             valid["quantity"].tolist(), valid["supplier_id"].tolist())
+                report.rows_loaded += len(valid)
+            if progress:
+                progress(report.rows_read, total)
+
+        if report.errors and strict:
+            report.rows_loaded = 0
+            raise ImportValidationError(report)
+        return report
+
+    @staticmethod
+    def _ingest(store, skus, names, quantities, supplier_ids):
+        load_columns = getattr(store, "load_columns", None)
+        if load_columns is not None:
+            load_columns(skus, names, quantities, supplier_ids)
         else:
-            raise ValueError("Unsupported file format. Please save as .csv or .xlsx")
+            for sku, name, quantity, supplier_id in zip(skus, names, quantities, supplier_ids):
+                store[sku] = Product.from_validated(sku, name, quantity, supplier_id)
+
+    @timed("inventory.save", rows=lambda written: written)
+    def save_to_file(self, filepath: str, progress: Optional[ProgressCallback] = None) -> int:
+        return write_products(filepath, self.products.values(), len(self.products), progress)
+
+    @timed("inventory.snapshot.save")
+    def save_snapshot(self, filepath: str):
+        write_snapshot(filepath, self.products.values())
+
+    @timed("inventory.snapshot.load")
+    def load_snapshot(self, filepath: str):
+        self._replace_products(*read_snapshot(filepath))
+
+    def attach_journal(self, journal):
+        # From here on every mutation is also appended to the journal.
+        self._journal = journal
+        self._indexes.append(journal)
+
+    def checkpoint(self):
+        if self._journal is not None:
+            self._journal.checkpoint(self.products.values())
+
+    def _compact_if_due(self):
+        # Called at the end of each mutation, never from a hook: the journal's
+        # hooks run before a delete has taken effect.
+        if self._journal is not None and self._journal.compact_due:
+            self.checkpoint()
+
+    def replay_journal(self, filepath: str) -> int:
+        records, _ = read_journal(filepath)
+        for record in records:
+            op, sku = record[0], record[1]
+            if op == OP_PUT:
+                if sku in self.products:
+                    self.delete_product(sku)
+                self.add_product(Product.from_validated(*record[1:]))
+            elif op == OP_QUANTITY and sku in self.products:
+                self.adjust_product_stock(sku, record[2] - self.products[sku].quantity)
+            elif op == OP_DELETE and sku in self.products:
+                self.delete_product(sku)
+        return len(records)
 
     def add_product(self, product: Product):
         if product.sku in self.products:
             raise ValueError(f"Product with SKU {product.sku} already exists.")
         self.products[product.sku] = product
+        self._on_add(product)
+        self._compact_if_due()
 
+    @timed("inventory.adjust")
     def adjust_product_stock(self, sku: str, amount: int):
         if sku not in self.products:
             raise KeyError(f"No product with SKU {sku}")
-        self.products[sku].adjust_stock(amount)
+        product = self.products[sku]
+        old_quantity = product.quantity
+        product.adjust_stock(amount)
+        self._on_quantity_change(product, old_quantity)
+        self._compact_if_due()
+
+    @timed("inventory.apply_adjustments", rows=lambda report: report.products_changed)
+    def apply_adjustments(self, lines: Iterable[Tuple[str, int]],
+                          line_numbers: Optional[Sequence[int]] = None) -> BatchReport:
+        # Lines for the same SKU are netted first, so the no-negative-stock rule
+        # applies to the batch as a whole and every SKU is touched once.
+        lines = list(lines)
+        totals = {}
+        get_total = totals.get
+        for sku, amount in lines:
+            totals[sku] = get_total(sku, 0) + amount
+
+        failures = {}
+        changes = []
+        products = self.products
+        for sku, total in totals.items():
+            product = products.get(sku)
+            if product is None:
+                failures[sku] = f"No product with SKU {sku}"
+            elif product.quantity + total < 0:
+                failures[sku] = f"Cannot reduce stock below zero for product {sku}"
+            elif total:
+                changes.append((product, total))
+        if failures:
+            return BatchReport(lines, failures, applied=False, line_numbers=line_numbers)
+
+        # Journaled as one record, so recovery never sees half a batch.
+        with self._journal.batch() if self._journal is not None else nullcontext():
+            for product, total in changes:
+                old_quantity = product.quantity
+                product.quantity = old_quantity + total
+                self._on_quantity_change(product, old_quantity)
+        self._compact_if_due()
+        return BatchReport(lines, failures, applied=True, products_changed=len(changes), line_numbers=line_numbers)
+
+    @timed("inventory.reconcile", rows=lambda result: result.rows_read)
+    def reconcile(self, filepath: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                  progress: Optional[ProgressCallback] = None) -> Reconciliation:
+        # Compares a count file with the current products without loading it;
+        # apply_adjustments(result.adjustments()) brings the inventory in line.
+        return reconcile(self.products, filepath, chunksize, progress)
 
+    @timed("inventory.low_stock", rows=len)
     def get_low_stock_products(self) -> List[Product]:
-        return [p for p in self.products.values() if p.quantity <= self.LOW_STOCK_THRESHOLD]
+        return [self.products[sku] for sku in self._quantity_index.skus_at_most(self.LOW_STOCK_THRESHOLD)]
+
+    def get_critical_stock_products(self) -> List[Product]:
+        return [self.products[sku] for sku in self._quantity_index.skus_at_most(self.CRITICAL_STOCK_THRESHOLD)]
+
+    def low_stock_count(self) -> int:
+        return self._quantity_index.count_at_most(self.LOW_STOCK_THRESHOLD)
+
+    def critical_stock_count(self) -> int:
+        return self._quantity_index.count_at_most(self.CRITICAL_STOCK_THRESHOLD)
+
+    @timed("inventory.search", rows=len)
+    def search_skus(self, query: str, mode: str = "substring") -> Set[str]:
+        # The search index is only built (and from then on maintained) once somebody searches.
+        if self._search_index is None:
+            self._search_index = SearchIndex()
+            self._search_index.rebuild(self.products.values())
+            self._indexes.append(self._search_index)
+        return self._search_index.search(query, mode)
+
+    def search_products(self, query: str, mode: str = "substring") -> List[Product]:
+        return [self.products[sku] for sku in sorted(self.search_skus(query, mode))]
+
+    @timed("inventory.sort", rows=len)
+    def sorted_products(self, field: str, reverse: bool = False,
+                        skus: Optional[Collection[str]] = None) -> List[Product]:
+        if field not in self.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by '{field}'. Expected one of: {', '.join(self.SORTABLE_FIELDS)}")
+        index = self._sort_indexes.get(field)
+        if index is None:
+            index = self._sort_indexes[field] = SortIndex(field)
+            index.rebuild(self.products.values())
+            self._indexes.append(index)
+        if skus is None:
+            return [self.products[sku] for sku in index.skus(reverse)]
+        if len(skus) * 16 < len(self.products):
+            # A handful of matches is cheaper to sort than to find by walking the whole index.
+            products = [self.products[sku] for sku in skus]
+            products.sort(key=lambda p: (getattr(p, field), p.sku), reverse=reverse)
+            return products
+        return [self.products[sku] for sku in index.skus(reverse) if sku in skus]
+
+    @timed("inventory.select", rows=len)
+    def select_products(self, query: Optional[str] = None, sort_field: Optional[str] = None,
+                        reverse: bool = False) -> Sequence[Product]:
+        # The filtered/sorted view the table and the service page through.
+        skus = self.search_skus(query) if query else None
+        if sort_field:
+            return self.sorted_products(sort_field, reverse=reverse, skus=skus)
+        if skus is not None:
+            return [self.products[sku] for sku in sorted(skus)]
+        return self.list_all_products()
+
+    def add_supplier(self, supplier: Supplier):
+        self.suppliers[supplier.supplier_id] = supplier
+
+    def supplier_name(self, supplier_id: str) -> str:
+        supplier = self.suppliers.get(supplier_id)
+        return supplier.name if supplier is not None else supplier_id
+
+    def _suppliers_index(self) -> SupplierIndex:
+        # Built on first use like the search index, then kept in sync by the mutation hooks.
+        # Its low-stock sets depend on the threshold, so a changed threshold rebuilds it.
+        if self._supplier_index is None:
+            self._supplier_index = SupplierIndex(self.LOW_STOCK_THRESHOLD)
+            self._supplier_index.rebuild(self.products.values())
+            self._indexes.append(self._supplier_index)
+        elif self._supplier_index.low_stock_threshold != self.LOW_STOCK_THRESHOLD:
+            self._supplier_index.low_stock_threshold = self.LOW_STOCK_THRESHOLD
+            self._supplier_index.rebuild(self.products.values())
+        return self._supplier_index
+
+    def get_supplier_products(self, supplier_id: str) -> List[Product]:
+        return [self.products[sku] for sku in sorted(self._suppliers_index().skus(supplier_id))]
+
+    def supplier_summaries(self) -> List[SupplierSummary]:
+        return [SupplierSummary(supplier_id, self.supplier_name(supplier_id), totals.products, totals.units,
+                                totals.low_stock)
+                for supplier_id, totals in sorted(self._suppliers_index().totals())]
+
+    def low_stock_by_supplier(self) -> Dict[str, List[Product]]:
+        return {supplier_id: [self.products[sku] for sku in skus]
+                for supplier_id, skus in self._suppliers_index().low_stock()}
 
     def list_all_products(self) -> List[Product]:
         return list(self.products.values())
@@ -94,4 +340,7 @@ class Inventory:
     def delete_product(self, sku: str):
         if sku not in self.products:
             raise KeyError(f"No product with SKU {sku} to delete.")
-        del self.products[sku]
\ No newline at end of file
+        product = self.products[sku]
+        self._on_remove(product)
+        del self.products[sku]
+        self._compact_if_due()
\ No newline at end of file
@@ -0,0 +1,207 @@
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from .snapshot import write_snapshot
+
+# Each record is framed as (body length, crc32 of body) followed by the body:
+# an op byte and its fields. Strings are length-prefixed UTF-8, quantities i64.
+# A torn or corrupt tail (e.g. after a crash mid-write) ends replay.
+#
+# Records are idempotent upserts/deletes, so replaying a log over a snapshot
+# that already contains its changes (a crash between writing the snapshot and
+# truncating the log) lands on the same state.
+#
+# A batch (Inventory.apply_adjustments) is one OP_BATCH frame whose body is
+# the batch's own framed records, so it is replayed whole or not at all.
+FRAME = struct.Struct("<II")
+QUANTITY = struct.Struct("<q")
+LENGTH = struct.Struct("<I")
+JOURNAL_EXTENSION = ".wal"
+
+OP_PUT = 1
+OP_QUANTITY = 2
+OP_DELETE = 3
+OP_BATCH = 4
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return LENGTH.pack(len(data)) + data
+
+
+def _unpack_str(body: bytes, offset: int) -> Tuple[str, int]:
+    (length,) = LENGTH.unpack_from(body, offset)
+    offset += LENGTH.size
+    return body[offset:offset + length].decode("utf-8"), offset + length
+
+
+def encode_record(op: int, sku: str, name: str = "", quantity: int = 0, supplier_id: str = "") -> bytes:
+    if op == OP_PUT:
+        body = bytes([op]) + _pack_str(sku) + _pack_str(name) + QUANTITY.pack(quantity) + _pack_str(supplier_id)
+    elif op == OP_QUANTITY:
+        body = bytes([op]) + _pack_str(sku) + QUANTITY.pack(quantity)
+    else:
+        body = bytes([op]) + _pack_str(sku)
+    return FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def encode_batch(records: bytes) -> bytes:
+    body = bytes([OP_BATCH]) + records
+    return FRAME.pack(len(body), zlib.crc32(body)) + body
+
+
+def decode_record(body: bytes) -> tuple:
+    op = body[0]
+    sku, offset = _unpack_str(body, 1)
+    if op == OP_PUT:
+        name, offset = _unpack_str(body, offset)
+        (quantity,) = QUANTITY.unpack_from(body, offset)
+        supplier_id, _ = _unpack_str(body, offset + QUANTITY.size)
+        return op, sku, name, quantity, supplier_id
+    if op == OP_QUANTITY:
+        return op, sku, QUANTITY.unpack_from(body, offset)[0]
+    if op == OP_DELETE:
+        return op, sku
+    raise ValueError(f"Unknown journal record type {op}")
+
+
+def read_journal(filepath: str) -> Tuple[List[tuple], int]:
+    """Return the decoded records and the byte length of the intact prefix of the log."""
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0
+
+    records = []
+    return records, _read_frames(data, 0, records)
+
+
+def _read_frames(data: bytes, offset: int, records: List[tuple]) -> int:
+    while offset + FRAME.size <= len(data):
+        length, crc = FRAME.unpack_from(data, offset)
+        body = data[offset + FRAME.size:offset + FRAME.size + length]
+        if len(body) < length or zlib.crc32(body) != crc:
+            break
+        if body[0] == OP_BATCH:
+            _read_frames(body, 1, records)
+        else:
+            records.append(decode_record(body))
+        offset += FRAME.size + length
+    return offset
+
+
+class Journal:
+    """Append-only write-ahead log of inventory mutations.
+
+    It is attached to an Inventory (``Inventory.attach_journal``) and receives
+    the same add/remove/update_quantity/rebuild calls as the indexes. Records
+    are buffered and written with one fsync per group: when ``group_size``
+    records are pending or ``max_delay`` seconds after the first one. After
+    ``compact_every`` records ``compact_due`` is set, and the inventory folds
+    the log into a fresh snapshot once the mutation in progress has finished
+    (a hook runs before a delete takes effect, so it must not snapshot).
+    """
+
+    def __init__(self, filepath: str, snapshot_path: str, group_size: int = 64,
+                 max_delay: float = 0.5, compact_every: int = 100_000):
+        self.filepath = filepath
+        self.snapshot_path = snapshot_path
+        self.group_size = group_size
+        self.max_delay = max_delay
+        self.compact_every = compact_every
+
+        records, valid_length = read_journal(filepath)
+        self._file = open(filepath, "ab")
+        if self._file.tell() != valid_length:
+            # Drop a torn tail so new records are not appended after garbage.
+            self._file.truncate(valid_length)
+        self.records_since_checkpoint = len(records)
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._batch = threading.local()
+
+    def add(self, product):
+        self._record(encode_record(OP_PUT, product.sku, product.name, product.quantity, product.supplier_id))
+
+    def remove(self, product):
+        self._record(encode_record(OP_DELETE, product.sku))
+
+    def update_quantity(self, product, old_quantity: int):
+        self._record(encode_record(OP_QUANTITY, product.sku, quantity=product.quantity))
+
+    @contextmanager
+    def batch(self):
+        # Records made by this thread inside the block are appended as one OP_BATCH frame.
+        if getattr(self._batch, "records", None) is not None:
+            yield
+            return
+        self._batch.records, self._batch.count = bytearray(), 0
+        try:
+            yield
+        finally:
+            records, count = self._batch.records, self._batch.count
+            self._batch.records = None
+            if count:
+                self._append(encode_batch(bytes(records)), count)
+
+    def _record(self, record: bytes):
+        records = getattr(self._batch, "records", None)
+        if records is None:
+            self._append(record)
+        else:
+            records += record
+            self._batch.count += 1
+
+    def rebuild(self, products):
+        # The whole catalogue was replaced (e.g. a file import): start over from a snapshot.
+        self.checkpoint(products)
+
+    def _append(self, record: bytes, count: int = 1):
+        with self._lock:
+            self._pending += record
+            self._pending_count += 1
+            self.records_since_checkpoint += count
+            if self._pending_count >= self.group_size:
+                self.sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self.sync)
+                self._timer.daemon = True
+                self._timer.start()
+
+    @property
+    def compact_due(self) -> bool:
+        return self.records_since_checkpoint >= self.compact_every
+
+    def sync(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending or self._file.closed:
+                return
+            self._file.write(self._pending)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending.clear()
+            self._pending_count = 0
+
+    def checkpoint(self, products):
+        with self._lock:
+            self.sync()
+            write_snapshot(self.snapshot_path, products)
+            self._file.truncate(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records_since_checkpoint = 0
+
+    def close(self):
+        with self._lock:
+            self.sync()
+            self._file.close()
@@ -1,19 +1,64 @@
-from .gui import App
+import os
+
+from .concurrency import ConcurrentInventory
 from .inventory import Inventory
+from .journal import JOURNAL_EXTENSION, Journal, read_journal
+from .snapshot import SNAPSHOT_EXTENSION
+
+DATA_FILE = "data/inventory.csv"
+
+def load_initial_inventory(inventory: Inventory, data_file: str = DATA_FILE) -> Journal:
+    # The snapshot plus the journal next to the data file hold the live state:
+    # use them while the journal has records that were never checkpointed (a
+    # "Save File" to the CSV does not fold them in) or the snapshot is at least
+    # as new as the CSV, otherwise start over from the CSV. Either way every
+    # later change is journaled.
+    base = os.path.splitext(data_file)[0]
+    snapshot_file = base + SNAPSHOT_EXTENSION
+    journal_file = base + JOURNAL_EXTENSION
+
+    restored = False
+    if os.path.exists(snapshot_file) and (
+            read_journal(journal_file)[1] > 0 or not os.path.exists(data_file)
+            or os.path.getmtime(snapshot_file) >= os.path.getmtime(data_file)):
+        try:
+            inventory.load_snapshot(snapshot_file)
+            inventory.replay_journal(journal_file)
+            restored = True
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable snapshot {snapshot_file}: {e}")
+
+    if not restored:
+        try:
+            inventory.load_from_file(data_file)
+        except FileNotFoundError:
+            print("Initial inventory.csv not found, starting with empty inventory.")
+
+    journal = Journal(journal_file, snapshot_file)
+    inventory.attach_journal(journal)
+    if not restored:
+        inventory.checkpoint()
+    return journal
 
 def main():
-    # Initialize the inventory
-    inventory = Inventory()
+    # The GUI toolkit is only imported by the desktop entry point, not by src.server.
+    from .gui import App
+
+    # Initialize the inventory; the table is filtered and sorted on a worker
+    # thread while the Tk thread edits it, so its queries must be thread-safe
+    inventory = ConcurrentInventory()
+    journals = []
     
-    # Load initial data from the default file
-    try:
-        inventory.load_from_file("data/inventory.csv")
-    except FileNotFoundError:
-        print("Initial inventory.csv not found, starting with empty inventory.")
+    # Load initial data from the default file once the window is up
+    def load():
+        journals.append(load_initial_inventory(inventory))
 
     # Launch the GUI application
-    app = App(inventory)
+    app = App(inventory, loader=load)
     app.mainloop()
 
+    for journal in journals:
+        journal.close()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
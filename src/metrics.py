@@ -0,0 +1,202 @@
+"""Opt-in timing histograms and counters for the inventory and the GUI.
+
+Off by default; turn it on with ``METRICS.enable()`` or by starting the
+application with ``INVENTORY_METRICS=1`` in the environment. While it is
+off, methods decorated with ``timed`` are the plain functions: the timing
+wrappers are only swapped onto their classes by ``enable()``.
+
+    from src.metrics import METRICS
+    METRICS.enable()
+    ...
+    METRICS.write("metrics.json")   # or metrics.prom for Prometheus text format
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+# Upper bounds of the latency buckets, in seconds.
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, math.inf)
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "last", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation.
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "sum": self.total, "last": self.last, "max": self.max,
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95),
+                "buckets": {str(bound): count for bound, count in zip(BUCKETS, self.counts)}}
+
+
+class Metrics:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.timers: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+        _install(True)
+
+    def disable(self):
+        self.enabled = False
+        _install(False)
+
+    def reset(self):
+        with self._lock:
+            self.timers.clear()
+            self.counters.clear()
+            self.gauges.clear()
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            histogram = self.timers.get(name)
+            if histogram is None:
+                histogram = self.timers[name] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, value: float):
+        if self.enabled:
+            self.gauges[name] = value
+
+    @contextmanager
+    def timer(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"timers": {name: h.to_dict() for name, h in sorted(self.timers.items())},
+                    "counters": dict(sorted(self.counters.items())),
+                    "gauges": dict(sorted(self.gauges.items()))}
+
+    def to_prometheus(self, prefix: str = "inventory_") -> str:
+        lines = []
+        with self._lock:
+            for name, histogram in sorted(self.timers.items()):
+                metric = prefix + _metric_name(name) + "_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(BUCKETS, histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f'{metric}_bucket{{le="{le}"}} {cumulative}')
+                lines.append(f"{metric}_sum {histogram.total!r}")
+                lines.append(f"{metric}_count {histogram.count}")
+            for name, value in sorted(self.counters.items()):
+                metric = prefix + _metric_name(name) + "_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+            for name, value in sorted(self.gauges.items()):
+                metric = prefix + _metric_name(name)
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, filepath: str):
+        # .json gets the snapshot as JSON; anything else the Prometheus text format.
+        if filepath.lower().endswith(".json"):
+            text = json.dumps(self.snapshot(), indent=2)
+        else:
+            text = self.to_prometheus()
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+_registry = []
+
+METRICS = Metrics(enabled=os.environ.get("INVENTORY_METRICS", "") not in ("", "0"))
+
+
+class _Instrumented:
+    # Only exists while the class body is being created: __set_name__ records
+    # the method and puts back either the plain function or, if metrics are
+    # already on, its timing wrapper.
+    def __init__(self, name: str, func, rows):
+        self.name = name
+        self.func = func
+        self.rows = rows
+
+    def __set_name__(self, owner, attribute: str):
+        wrapper = _wrap(self.name, self.func, self.rows)
+        _registry.append((owner, attribute, self.func, wrapper))
+        setattr(owner, attribute, wrapper if METRICS.enabled else self.func)
+
+
+def _wrap(name: str, func, rows):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            METRICS.observe(name, time.perf_counter() - start)
+        if rows is not None:
+            METRICS.count(f"{name}.rows", rows(result))
+        return result
+    return wrapper
+
+
+def _install(enabled: bool):
+    for owner, attribute, func, wrapper in _registry:
+        setattr(owner, attribute, wrapper if enabled else func)
+
+
+def timed(name: str, rows: Optional[Callable[[object], int]] = None):
+    """Method decorator: time each call under ``name`` while metrics are enabled.
+
+    ``rows(result)`` is added to the ``<name>.rows`` counter. The timing
+    wrapper is only on the class while metrics are on; a bound method taken
+    before ``enable()`` stays uninstrumented.
+    """
+    def decorate(func):
+        return _Instrumented(name, func, rows)
+    return decorate
@@ -0,0 +1,136 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from .bulk import FIRST_DATA_LINE, REQUIRED_COLUMNS, ImportValidationError, LoadReport, RowError, validate_frame
+from .streaming import ProgressCallback, iter_chunks
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# How a SKU listed in more than one file is merged:
+#   sum     quantities are added up; name and supplier come from the last file
+#   last    the row from the last file (in the order given) wins
+#   reject  later occurrences are errors, as duplicates within one file are
+CONFLICT_POLICIES = ("sum", "last", "reject")
+
+
+class MultiLoadReport(LoadReport):
+    """A LoadReport over several files; ``files`` keeps each file's own report."""
+
+    def __init__(self):
+        super().__init__()
+        self.files: Dict[str, LoadReport] = {}
+        self.conflicts = 0
+
+    def summary(self, limit: int = 10) -> str:
+        text = super().summary(limit)
+        if self.ok:
+            text = f"{text[:-1]} from {len(self.files)} file(s); {self.conflicts} SKU(s) merged across files."
+        return text
+
+
+def parse_file(filepath: str, chunksize: Optional[int] = None) -> Tuple["pd.DataFrame", LoadReport]:
+    """Read and validate one file; runs in a worker process.
+
+    Returns the valid rows (with their file line in a ``line`` column) and the
+    file's report.
+    """
+    import pandas as pd
+    report = LoadReport()
+    frames = []
+    seen = set()
+    line = FIRST_DATA_LINE
+    for df in iter_chunks(filepath, chunksize):
+        df = df.reset_index(drop=True)
+        valid, errors = validate_frame(df, line, seen)
+        valid["line"] = valid.index + line
+        frames.append(valid)
+        line += len(df)
+        report.rows_read += len(df)
+        report.errors.extend(errors)
+    report.rows_loaded = sum(len(frame) for frame in frames)
+    if not frames:
+        # A header-only workbook yields no chunks at all.
+        return pd.DataFrame(columns=REQUIRED_COLUMNS + ["line"]), report
+    return pd.concat(frames, ignore_index=True), report
+
+
+def parse_files(filepaths: Sequence[str], workers: Optional[int] = None, chunksize: Optional[int] = None,
+                progress: Optional[ProgressCallback] = None) -> List[Tuple["pd.DataFrame", LoadReport]]:
+    # Results come back in the order the files were given, whichever finishes first.
+    workers = min(workers or os.cpu_count() or 1, len(filepaths))
+    rows_done = 0
+    if workers <= 1:
+        results = []
+        for filepath in filepaths:
+            results.append(parse_file(filepath, chunksize))
+            rows_done += results[-1][1].rows_read
+            if progress:
+                progress(rows_done, None)
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_file, filepath, chunksize) for filepath in filepaths]
+        results = []
+        for future in futures:
+            results.append(future.result())
+            rows_done += results[-1][1].rows_read
+            if progress:
+                progress(rows_done, None)
+        return results
+
+
+def merge_frames(filepaths: Sequence[str], parsed: List[Tuple["pd.DataFrame", LoadReport]],
+                 policy: str = "sum") -> Tuple["pd.DataFrame", MultiLoadReport]:
+    import pandas as pd
+    if policy not in CONFLICT_POLICIES:
+        raise ValueError(f"Unknown conflict policy '{policy}'. Expected one of: {', '.join(CONFLICT_POLICIES)}")
+
+    report = MultiLoadReport()
+    frames = []
+    for position, (filepath, (frame, file_report)) in enumerate(zip(filepaths, parsed)):
+        name = os.path.basename(filepath)
+        report.files[filepath] = file_report
+        report.rows_read += file_report.rows_read
+        report.errors.extend(RowError(e.line, e.sku, f"{name}: {e.message}") for e in file_report.errors)
+        frames.append(frame.assign(file=position))
+    rows = pd.concat(frames, ignore_index=True)
+
+    repeated = rows["sku"].duplicated(keep="first")
+    report.conflicts = rows.loc[repeated, "sku"].nunique()
+    if policy == "reject":
+        first_file = rows.drop_duplicates("sku").set_index("sku")["file"]
+        for sku, line, position in rows.loc[repeated, ["sku", "line", "file"]].itertuples(index=False):
+            other = os.path.basename(filepaths[first_file[sku]])
+            report.errors.append(RowError(int(line), sku, f"{os.path.basename(filepaths[position])}: "
+                                                          f"Duplicate SKU {sku} (already in {other})"))
+        merged = rows[~repeated]
+    elif policy == "last":
+        merged = rows.drop_duplicates("sku", keep="last")
+    else:
+        merged = rows.groupby("sku", sort=False).agg(
+            name=("name", "last"), quantity=("quantity", "sum"), supplier_id=("supplier_id", "last")).reset_index()
+    report.rows_loaded = len(merged)
+    return merged, report
+
+
+def load_files(filepaths: Sequence[str], policy: str = "sum", strict: bool = True, workers: Optional[int] = None,
+               chunksize: Optional[int] = None, progress: Optional[ProgressCallback] = None):
+    """Parse ``filepaths`` in parallel and merge them into one set of columns.
+
+    Returns ``((skus, names, quantities, supplier_ids), report)``; in strict
+    mode any invalid row or rejected duplicate raises ImportValidationError.
+    """
+    filepaths = list(filepaths)
+    if not filepaths:
+        raise ValueError("No files to import")
+    if policy not in CONFLICT_POLICIES:
+        raise ValueError(f"Unknown conflict policy '{policy}'. Expected one of: {', '.join(CONFLICT_POLICIES)}")
+    merged, report = merge_frames(filepaths, parse_files(filepaths, workers, chunksize, progress), policy)
+    if report.errors and strict:
+        report.rows_loaded = 0
+        raise ImportValidationError(report)
+    columns = (merged["sku"].tolist(), merged["name"].tolist(), merged["quantity"].astype("int64").tolist(),
+               merged["supplier_id"].tolist())
+    return columns, report
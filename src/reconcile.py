@@ -0,0 +1,131 @@
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from .bulk import FIRST_DATA_LINE, RowError, validate_frame
+from .streaming import DEFAULT_CHUNKSIZE, ProgressCallback, iter_chunks
+
+
+class Added(NamedTuple):
+    sku: str
+    name: str
+    quantity: int
+    supplier_id: str
+
+
+class Removed(NamedTuple):
+    sku: str
+    name: str
+    quantity: int
+
+
+class Changed(NamedTuple):
+    sku: str
+    old_quantity: int
+    new_quantity: int
+
+    @property
+    def delta(self) -> int:
+        return self.new_quantity - self.old_quantity
+
+
+class Reconciliation:
+    """Differences between a set of products and a count file.
+
+    Only differences are kept: unchanged rows are counted, not stored.
+    """
+
+    def __init__(self):
+        self.added: List[Added] = []
+        self.removed: List[Removed] = []
+        self.changed: List[Changed] = []
+        self.unchanged = 0
+        self.rows_read = 0
+        self.errors: List[RowError] = []
+
+    @property
+    def in_sync(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def adjustments(self, zero_missing: bool = False) -> List[Tuple[str, int]]:
+        """The deltas as (sku, amount) lines for Inventory.apply_adjustments.
+
+        With ``zero_missing`` products absent from the count are taken down to
+        zero. Added SKUs are not included; they have no product to adjust.
+        """
+        lines = [(change.sku, change.delta) for change in self.changed]
+        if zero_missing:
+            lines.extend((removed.sku, -removed.quantity) for removed in self.removed if removed.quantity)
+        return lines
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [f"{self.rows_read} counted row(s): {self.unchanged} unchanged, {len(self.changed)} changed, "
+                 f"{len(self.added)} not in inventory, {len(self.removed)} missing from the count."]
+        for change in self.changed[:limit]:
+            lines.append(f"  {change.sku}: {change.old_quantity} -> {change.new_quantity} ({change.delta:+d})")
+        if len(self.changed) > limit:
+            lines.append(f"  ... and {len(self.changed) - limit} more changes")
+        if self.errors:
+            lines.append(f"{len(self.errors)} invalid row(s) skipped, e.g. line {self.errors[0].line} "
+                         f"({self.errors[0].sku}): {self.errors[0].message}")
+        return "\n".join(lines)
+
+
+def _quantities(products: Mapping, skus: List[str]) -> Dict[str, int]:
+    # Stores may look a whole chunk up at once (SQLiteProductStore.quantities).
+    lookup = getattr(products, "quantities", None)
+    if lookup is not None:
+        return lookup(skus)
+    get = products.get
+    found = {}
+    for sku in skus:
+        product = get(sku)
+        if product is not None:
+            found[sku] = product.quantity
+    return found
+
+
+def reconcile(products: Mapping, filepath: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+              progress: Optional[ProgressCallback] = None) -> Reconciliation:
+    """Stream ``filepath`` chunk by chunk and hash-join it against ``products`` by SKU.
+
+    Runs in one pass over the file plus one over ``products``; memory is one
+    chunk, the set of matched SKUs and the differences found.
+    """
+    result = Reconciliation()
+    matched = set()
+    line = FIRST_DATA_LINE
+    for df in iter_chunks(filepath, chunksize):
+        valid, errors = validate_frame(df, line, matched)
+        line += len(df)
+        result.rows_read += len(df)
+        result.errors.extend(errors)
+
+        skus = valid["sku"].tolist()
+        quantities = valid["quantity"].tolist()
+        current = _quantities(products, skus)
+        for position, (sku, quantity) in enumerate(zip(skus, quantities)):
+            old = current.get(sku)
+            if old is None:
+                result.added.append(Added(sku, valid["name"].iat[position], quantity,
+                                          valid["supplier_id"].iat[position]))
+            elif old != quantity:
+                result.changed.append(Changed(sku, old, quantity))
+            else:
+                result.unchanged += 1
+        if progress:
+            progress(result.rows_read, None)
+
+    # validate_frame added every accepted SKU to ``matched``, including added ones.
+    for product in products.values():
+        if product.sku not in matched:
+            result.removed.append(Removed(product.sku, product.name, product.quantity))
+    return result
+
+
+def diff_files(old_path: str, new_path: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+               progress: Optional[ProgressCallback] = None) -> Reconciliation:
+    """Compare two exports; the older one is held in a columnar store while the newer one streams past it."""
+    from .columnar import ColumnarProductStore
+    from .inventory import Inventory
+    base = Inventory(store=ColumnarProductStore())
+    base.load_from_file(old_path, strict=False, chunksize=chunksize)
+    return reconcile(base.products, new_path, chunksize, progress)
@@ -0,0 +1,51 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+from .streaming import ProgressCallback, write_rows
+
+# Low-stock products are reordered back up to this many units unless told otherwise.
+DEFAULT_TARGET_LEVEL = 20
+
+PURCHASE_ORDER_COLUMNS = ["supplier_id", "supplier_name", "sku", "name", "quantity", "order_quantity"]
+
+
+class SupplierSummary(NamedTuple):
+    supplier_id: str
+    name: str
+    products: int
+    units: int
+    low_stock: int
+
+
+class ReorderLine(NamedTuple):
+    sku: str
+    name: str
+    quantity: int
+    order_quantity: int
+
+
+class PurchaseOrder(NamedTuple):
+    supplier_id: str
+    supplier_name: str
+    lines: Tuple[ReorderLine, ...]
+
+    @property
+    def total_units(self) -> int:
+        return sum(line.order_quantity for line in self.lines)
+
+
+def build_purchase_orders(inventory, target_level: int = DEFAULT_TARGET_LEVEL) -> List[PurchaseOrder]:
+    """One purchase order per supplier with low-stock products, topping each one up to ``target_level``."""
+    orders = []
+    for supplier_id, products in sorted(inventory.low_stock_by_supplier().items()):
+        lines = tuple(ReorderLine(p.sku, p.name, p.quantity, target_level - p.quantity)
+                      for p in sorted(products, key=lambda p: p.sku) if p.quantity < target_level)
+        if lines:
+            orders.append(PurchaseOrder(supplier_id, inventory.supplier_name(supplier_id), lines))
+    return orders
+
+
+def write_purchase_orders(filepath: str, orders: List[PurchaseOrder],
+                          progress: Optional[ProgressCallback] = None) -> int:
+    rows = ((order.supplier_id, order.supplier_name, line.sku, line.name, line.quantity, line.order_quantity)
+            for order in orders for line in order.lines)
+    return write_rows(filepath, PURCHASE_ORDER_COLUMNS, rows, sum(len(order.lines) for order in orders), progress)
@@ -0,0 +1,249 @@
+"""Headless HTTP/JSON front-end over a single in-process Inventory.
+
+    python -m src.server --port 8080
+
+Endpoints:
+    GET  /products?q=&sort=&reverse=         streamed JSON array of products
+    GET  /products/<sku>                     one product
+    GET  /low-stock                          streamed JSON array of low-stock products
+    POST /products/<sku>/adjust              body {"amount": <int>}
+    GET  /metrics                            metrics.METRICS snapshot (when enabled)
+
+Stock adjustments arriving within ``batch_window`` seconds of each other are
+coalesced into one Inventory.apply_adjustments call.
+"""
+import argparse
+import asyncio
+import json
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .inventory import Inventory
+from .metrics import METRICS
+
+STREAM_BATCH = 500
+MAX_BODY = 1 << 20
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def product_json(product) -> dict:
+    return {"sku": product.sku, "name": product.name, "quantity": product.quantity,
+            "supplier_id": product.supplier_id}
+
+
+class AdjustmentBatcher:
+    def __init__(self, inventory: Inventory, batch_window: float = 0.002, max_batch: int = 1000):
+        self.inventory = inventory
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.batches = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def adjust(self, sku: str, amount: int) -> int:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((sku, amount, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(pending) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                self._apply(pending)
+            except Exception as e:
+                # Fail this batch (a journal write error, say) but keep serving later ones.
+                for _, _, future in pending:
+                    if not future.done():
+                        future.set_exception(HTTPError(500, f"Adjustment failed: {e}"))
+
+    def _apply(self, pending: List[Tuple[str, int, asyncio.Future]]):
+        self.batches += 1
+        METRICS.count("server.adjust.batches")
+        METRICS.count("server.adjust.requests", len(pending))
+        report = self.inventory.apply_adjustments((sku, amount) for sku, amount, _ in pending)
+        failed = report.failures
+        if failed:
+            # Requests for SKUs whose netted total failed are retried one by one so
+            # each gets its own answer; every other SKU is unaffected and goes as a batch.
+            self.inventory.apply_adjustments((sku, amount) for sku, amount, _ in pending if sku not in failed)
+        for sku, amount, future in pending:
+            if future.done():
+                continue
+            if sku in failed:
+                try:
+                    self.inventory.adjust_product_stock(sku, amount)
+                except KeyError:
+                    future.set_exception(HTTPError(404, f"No product with SKU {sku}"))
+                    continue
+                except ValueError as e:
+                    future.set_exception(HTTPError(409, str(e)))
+                    continue
+            future.set_result(self.inventory.products[sku].quantity)
+
+
+class InventoryServer:
+    def __init__(self, inventory: Inventory, batch_window: float = 0.002):
+        self.inventory = inventory
+        self.batcher = AdjustmentBatcher(inventory, batch_window)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> int:
+        self.batcher.start()
+        self._server = await asyncio.start_server(self.handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                    length = int(headers.get("content-length", 0))
+                    if length > MAX_BODY:
+                        raise HTTPError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    await self.dispatch(writer, method, target, body, keep_alive)
+                except HTTPError as e:
+                    await self.send_json(writer, e.status, {"error": str(e)}, keep_alive)
+                except ValueError as e:
+                    await self.send_json(writer, 400, {"error": str(e)}, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, writer, method: str, target: str, body: bytes, keep_alive: bool):
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if parts == ["products"] and method == "GET":
+            await self.stream_products(writer, self.list_products(query), keep_alive)
+        elif parts == ["metrics"] and method == "GET":
+            await self.send_json(writer, 200, METRICS.snapshot(), keep_alive)
+        elif parts == ["low-stock"] and method == "GET":
+            await self.stream_products(writer, self.inventory.get_low_stock_products(), keep_alive)
+        elif len(parts) == 2 and parts[0] == "products" and method == "GET":
+            product = self.inventory.products.get(parts[1])
+            if product is None:
+                raise HTTPError(404, f"No product with SKU {parts[1]}")
+            await self.send_json(writer, 200, product_json(product), keep_alive)
+        elif len(parts) == 3 and parts[0] == "products" and parts[2] == "adjust":
+            if method != "POST":
+                raise HTTPError(405, "Use POST to adjust stock")
+            payload = json.loads(body or b"{}")
+            amount = payload.get("amount") if isinstance(payload, dict) else None
+            if not isinstance(amount, int) or isinstance(amount, bool):
+                raise HTTPError(400, "Body must be {\"amount\": <integer>}")
+            quantity = await self.batcher.adjust(parts[1], amount)
+            await self.send_json(writer, 200, {"sku": parts[1], "quantity": quantity}, keep_alive)
+        else:
+            raise HTTPError(404, f"No route for {method} {url.path}")
+
+    def list_products(self, query: dict):
+        return self.inventory.select_products(query.get("q"), query.get("sort"), reverse=query.get("reverse") == "true")
+
+    @staticmethod
+    def _head(status: int, keep_alive: bool, extra: str) -> bytes:
+        connection = "keep-alive" if keep_alive else "close"
+        return (f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+                f"Connection: {connection}\r\n{extra}\r\n").encode("latin-1")
+
+    async def send_json(self, writer, status: int, payload, keep_alive: bool):
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(self._head(status, keep_alive, f"Content-Length: {len(data)}\r\n") + data)
+        await writer.drain()
+
+    async def stream_products(self, writer, products, keep_alive: bool):
+        # Chunked transfer encoding: the listing is sent STREAM_BATCH products at a time.
+        writer.write(self._head(200, keep_alive, "Transfer-Encoding: chunked\r\n"))
+        separator = "["
+        for start in range(0, len(products), STREAM_BATCH):
+            batch = products[start:start + STREAM_BATCH]
+            data = (separator + ",".join(json.dumps(product_json(p)) for p in batch)).encode("utf-8")
+            separator = ","
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+        tail = b"[]" if separator == "[" else b"]"
+        writer.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(tail), tail))
+        await writer.drain()
+
+
+async def serve(inventory: Inventory, host: str, port: int):
+    server = InventoryServer(inventory)
+    port = await server.start(host, port)
+    print(f"Serving inventory on http://{host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    from .main import DATA_FILE, load_initial_inventory
+
+    parser = argparse.ArgumentParser(description="Serve the inventory over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--data", default=DATA_FILE, help="inventory CSV; its snapshot and journal sit next to it")
+    args = parser.parse_args()
+
+    inventory = Inventory()
+    journal = load_initial_inventory(inventory, args.data)
+    try:
+        asyncio.run(serve(inventory, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        journal.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+# Layout (little-endian):
+#   header   magic, version, product count, string table size in bytes
+#   strings  UTF-8 strings joined by NUL, padded to 8 bytes
+#   columns  sku ids (u32), name ids (u32), supplier ids (u32), padding, quantities (i64)
+# SKUs, names and supplier IDs are ids into the shared, de-duplicated string table.
+MAGIC = b"INVSNAP\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sI4xQQ")
+SNAPSHOT_EXTENSION = ".invsnap"
+
+
+def _pad(size: int) -> int:
+    return -size % 8
+
+
+def _little_endian(column: array) -> array:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column
+
+
+def write_snapshot(filepath: str, products: Iterable):
+    strings: List[str] = []
+    ids: Dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        string_id = ids.get(value)
+        if string_id is None:
+            if "\x00" in value:
+                raise ValueError(f"Cannot store a value containing NUL in a snapshot: {value!r}")
+            string_id = ids[value] = len(strings)
+            strings.append(value)
+        return string_id
+
+    sku_ids, name_ids, supplier_ids, quantities = array("I"), array("I"), array("I"), array("q")
+    for product in products:
+        sku_ids.append(string_id(product.sku))
+        name_ids.append(string_id(product.name))
+        supplier_ids.append(string_id(product.supplier_id))
+        quantities.append(product.quantity)
+
+    blob = "\x00".join(strings).encode("utf-8")
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(quantities), len(blob)))
+        f.write(blob + b"\x00" * _pad(len(blob)))
+        for column in (sku_ids, name_ids, supplier_ids):
+            f.write(_little_endian(column).tobytes())
+        f.write(b"\x00" * _pad(len(sku_ids) * 3 * sku_ids.itemsize))
+        f.write(_little_endian(quantities).tobytes())
+    os.replace(tmp_path, filepath)
+
+
+def read_snapshot(filepath: str) -> Tuple[List[str], List[str], List[int], List[str]]:
+    with open(filepath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            if len(view) < HEADER.size:
+                raise ValueError(f"{filepath} is not an inventory snapshot")
+            magic, version, count, blob_size = HEADER.unpack_from(view)
+            if magic != MAGIC:
+                raise ValueError(f"{filepath} is not an inventory snapshot")
+            if version != VERSION:
+                raise ValueError(f"Unsupported snapshot version {version}")
+
+            offset = HEADER.size
+            blob = view[offset:offset + blob_size]
+            strings = str(blob, "utf-8").split("\x00") if blob_size else [""]
+            blob.release()
+            offset += blob_size + _pad(blob_size)
+
+            columns = []
+            for typecode in ("I", "I", "I", "q"):
+                if typecode == "q":
+                    offset += _pad(offset)
+                column = array(typecode)
+                column.frombytes(view[offset:offset + count * column.itemsize])
+                if sys.byteorder != "little":
+                    column.byteswap()
+                offset += count * column.itemsize
+                columns.append(column)
+        finally:
+            view.release()
+
+    sku_ids, name_ids, supplier_ids, quantities = columns
+    lookup = strings.__getitem__
+    return (list(map(lookup, sku_ids)), list(map(lookup, name_ids)),
+            quantities.tolist(), list(map(lookup, supplier_ids)))
@@ -0,0 +1,363 @@
+import sqlite3
+import threading
+from collections.abc import MutableMapping, Sequence, ValuesView
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set
+
+from .inventory import Inventory, Product
+from .metrics import timed
+from .reports import SupplierSummary
+from .streaming import DEFAULT_CHUNKSIZE, ProgressCallback
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    sku TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    quantity INTEGER NOT NULL CHECK (quantity >= 0),
+    supplier_id TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS products_supplier_id ON products (supplier_id);
+CREATE INDEX IF NOT EXISTS products_quantity ON products (quantity);
+CREATE INDEX IF NOT EXISTS products_name ON products (name);
+
+-- Running per-supplier totals, maintained by triggers so summaries read one row per supplier.
+CREATE TABLE IF NOT EXISTS supplier_totals (
+    supplier_id TEXT PRIMARY KEY,
+    products INTEGER NOT NULL,
+    units INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS products_insert_totals AFTER INSERT ON products BEGIN
+    INSERT INTO supplier_totals VALUES (NEW.supplier_id, 1, NEW.quantity)
+    ON CONFLICT (supplier_id) DO UPDATE SET products = products + 1, units = units + excluded.units;
+END;
+CREATE TRIGGER IF NOT EXISTS products_delete_totals AFTER DELETE ON products BEGIN
+    UPDATE supplier_totals SET products = products - 1, units = units - OLD.quantity
+    WHERE supplier_id = OLD.supplier_id;
+    DELETE FROM supplier_totals WHERE supplier_id = OLD.supplier_id AND products = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS products_update_totals AFTER UPDATE OF quantity, supplier_id ON products BEGIN
+    UPDATE supplier_totals SET products = products - 1, units = units - OLD.quantity
+    WHERE supplier_id = OLD.supplier_id;
+    INSERT INTO supplier_totals VALUES (NEW.supplier_id, 1, NEW.quantity)
+    ON CONFLICT (supplier_id) DO UPDATE SET products = products + 1, units = units + excluded.units;
+    DELETE FROM supplier_totals WHERE supplier_id = OLD.supplier_id AND products = 0;
+END;
+"""
+
+UPSERT = """
+INSERT INTO products (sku, name, quantity, supplier_id) VALUES (?, ?, ?, ?)
+ON CONFLICT (sku) DO UPDATE SET name = excluded.name, quantity = excluded.quantity,
+                                supplier_id = excluded.supplier_id
+"""
+
+COLUMNS = "sku, name, quantity, supplier_id"
+
+
+class SQLiteProductView(Product):
+    """A Product backed by a row in a SQLiteProductStore; assignments are written straight back."""
+
+    __slots__ = ("_store", "_sku")
+
+    def __init__(self, store: "SQLiteProductStore", sku: str):
+        self._store = store
+        self._sku = sku
+
+    @property
+    def sku(self) -> str:
+        return self._sku
+
+    def _get(self, column: str):
+        row = self._store._execute(f"SELECT {column} FROM products WHERE sku = ?", (self._sku,)).fetchone()
+        if row is None:
+            raise KeyError(self._sku)
+        return row[0]
+
+    def _set(self, column: str, value):
+        self._store._execute(f"UPDATE products SET {column} = ? WHERE sku = ?", (value, self._sku))
+
+    name = property(lambda self: self._get("name"), lambda self, value: self._set("name", value))
+    quantity = property(lambda self: self._get("quantity"), lambda self, value: self._set("quantity", value))
+    supplier_id = property(lambda self: self._get("supplier_id"), lambda self, value: self._set("supplier_id", value))
+
+    def __repr__(self):
+        return f"SQLiteProductView({self.sku!r})"
+
+
+class _StreamingValues(ValuesView):
+    # One cursor over the table instead of a lookup per key.
+    def __iter__(self):
+        return self._mapping.iter_products()
+
+
+class SQLiteProductStore(MutableMapping):
+    """SKU -> Product mapping kept in a SQLite database (WAL mode).
+
+    Lookups return write-through views; bulk reads (``values()``,
+    ``iter_products``, ``query``) return detached Product objects built from
+    one cursor. The connection is shared across threads behind a lock.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._in_transaction = False
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def _execute(self, sql: str, parameters=()) -> sqlite3.Cursor:
+        with self._lock:
+            return self._connection.execute(sql, parameters)
+
+    def _fetchall(self, sql: str, parameters=()) -> list:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+            self._connection.execute("BEGIN")
+            self._in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            else:
+                self._connection.execute("COMMIT")
+            finally:
+                self._in_transaction = False
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def __iter__(self):
+        return (row[0] for row in self._fetchall("SELECT sku FROM products ORDER BY sku"))
+
+    def __contains__(self, sku) -> bool:
+        return self._execute("SELECT 1 FROM products WHERE sku = ?", (sku,)).fetchone() is not None
+
+    def __getitem__(self, sku: str) -> SQLiteProductView:
+        if sku not in self:
+            raise KeyError(sku)
+        return SQLiteProductView(self, sku)
+
+    def __setitem__(self, sku: str, product: Product):
+        self._execute(UPSERT, (sku, product.name, product.quantity, product.supplier_id))
+
+    def __delitem__(self, sku: str):
+        if self._execute("DELETE FROM products WHERE sku = ?", (sku,)).rowcount == 0:
+            raise KeyError(sku)
+
+    def clear(self):
+        self._execute("DELETE FROM products")
+
+    def values(self):
+        return _StreamingValues(self)
+
+    def load_columns(self, skus: Iterable[str], names: Iterable[str],
+                     quantities: Iterable[int], supplier_ids: Iterable[str]):
+        with self.transaction():
+            self._connection.executemany(UPSERT, zip(skus, names, quantities, supplier_ids))
+
+    def quantities(self, skus: Iterable[str], batch: int = 500) -> Dict[str, int]:
+        skus = list(skus)
+        found = {}
+        for start in range(0, len(skus), batch):
+            chunk = skus[start:start + batch]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self._fetchall(f"SELECT sku, quantity FROM products WHERE sku IN ({placeholders})", chunk))
+        return found
+
+    def iter_products(self, where: str = "", parameters=(), order_by: str = "sku",
+                      limit: int = -1, offset: int = 0, batch: int = 1000):
+        sql = f"SELECT {COLUMNS} FROM products {where} ORDER BY {order_by} LIMIT ? OFFSET ?"
+        with self._lock:
+            cursor = self._connection.execute(sql, (*parameters, limit, offset))
+            rows = cursor.fetchmany(batch)
+        while rows:
+            for row in rows:
+                yield Product.from_validated(*row)
+            with self._lock:
+                rows = cursor.fetchmany(batch)
+
+    def query(self, where: str = "", parameters=(), order_by: str = "sku",
+              limit: int = -1, offset: int = 0) -> List[Product]:
+        sql = f"SELECT {COLUMNS} FROM products {where} ORDER BY {order_by} LIMIT ? OFFSET ?"
+        return [Product.from_validated(*row) for row in self._fetchall(sql, (*parameters, limit, offset))]
+
+    def count(self, where: str = "", parameters=()) -> int:
+        return self._execute(f"SELECT COUNT(*) FROM products {where}", parameters).fetchone()[0]
+
+
+class PagedProducts(Sequence):
+    """A read-only sequence over one filtered, sorted query, fetched a page at a time."""
+
+    PAGE_SIZE = 200
+
+    def __init__(self, store: SQLiteProductStore, where: str, parameters: tuple, order_by: str):
+        self.store = store
+        self.where = where
+        self.parameters = parameters
+        self.order_by = order_by
+        self._length = store.count(where, parameters)
+        self._pages = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.store.query(self.where, self.parameters, self.order_by, max(0, stop - start), start)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        page, position = divmod(index, self.PAGE_SIZE)
+        if page not in self._pages:
+            if len(self._pages) > 64:
+                self._pages.clear()
+            self._pages[page] = self.store.query(self.where, self.parameters, self.order_by,
+                                                 self.PAGE_SIZE, page * self.PAGE_SIZE)
+        return self._pages[page][position]
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SQLiteInventory(Inventory):
+    """An Inventory whose products live in SQLite and whose queries run in the database.
+
+    The in-memory indexes are not used: low-stock, search and sort queries are
+    pushed down to SQL (backed by indexes on sku, supplier_id, quantity and
+    name) and ``select_products`` returns a PagedProducts sequence, so a
+    caller paging through results never loads the whole catalogue.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        super().__init__(SQLiteProductStore(path))
+        self._indexes = []
+
+    def attach_journal(self, journal):
+        # Every change is already committed to the database, so there is nothing to journal.
+        raise TypeError("SQLiteInventory is already durable; it does not use a journal")
+
+    @timed("inventory.load", rows=lambda report: report.rows_read)
+    def load_from_file(self, filepath: str, strict: bool = True, chunksize: Optional[int] = DEFAULT_CHUNKSIZE,
+                       progress: Optional[ProgressCallback] = None):
+        # Chunks are upserted inside one transaction, which a failed strict load rolls back.
+        with self.products.transaction():
+            self.products.clear()
+            return self._ingest_file(self.products, filepath, strict, chunksize, progress)
+
+    def _replace_products(self, skus, names, quantities, supplier_ids):
+        with self.products.transaction():
+            self.products.clear()
+            self.products.load_columns(skus, names, quantities, supplier_ids)
+
+    @timed("inventory.adjust")
+    def adjust_product_stock(self, sku: str, amount: int):
+        cursor = self.products._execute(
+            "UPDATE products SET quantity = quantity + ? WHERE sku = ? AND quantity + ? >= 0", (amount, sku, amount))
+        if cursor.rowcount == 0:
+            if sku not in self.products:
+                raise KeyError(f"No product with SKU {sku}")
+            raise ValueError(f"Cannot reduce stock below zero for product {sku}")
+
+    def apply_adjustments(self, lines, line_numbers=None):
+        with self.products.transaction():
+            return super().apply_adjustments(lines, line_numbers)
+
+    @timed("inventory.low_stock", rows=len)
+    def get_low_stock_products(self) -> List[Product]:
+        return self.products.query("WHERE quantity <= ?", (self.LOW_STOCK_THRESHOLD,), "quantity, sku")
+
+    def get_critical_stock_products(self) -> List[Product]:
+        return self.products.query("WHERE quantity <= ?", (self.CRITICAL_STOCK_THRESHOLD,), "quantity, sku")
+
+    def low_stock_count(self) -> int:
+        return self.products.count("WHERE quantity <= ?", (self.LOW_STOCK_THRESHOLD,))
+
+    def critical_stock_count(self) -> int:
+        return self.products.count("WHERE quantity <= ?", (self.CRITICAL_STOCK_THRESHOLD,))
+
+    def _search_clause(self, query: str, mode: str = "substring"):
+        query = query.strip()
+        if mode == "substring":
+            pattern = f"%{_like_escape(query)}%"
+            return "WHERE (sku LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\')", (pattern, pattern)
+        if mode == "prefix":
+            return "WHERE sku LIKE ? ESCAPE '\\'", (f"{_like_escape(query)}%",)
+        if mode == "token":
+            clauses, parameters = [], []
+            for word in query.split():
+                word = _like_escape(word)
+                clauses.append("(name LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\')")
+                parameters += [f"{word}%", f"% {word}%"]
+            return "WHERE " + " AND ".join(clauses), tuple(parameters)
+        raise ValueError(f"Unknown search mode '{mode}'. Expected one of: substring, prefix, token")
+
+    @timed("inventory.search", rows=len)
+    def search_skus(self, query: str, mode: str = "substring") -> Set[str]:
+        if not query.strip():
+            return set(self.products)
+        where, parameters = self._search_clause(query, mode)
+        return {row[0] for row in self.products._fetchall(f"SELECT sku FROM products {where}", parameters)}
+
+    def search_products(self, query: str, mode: str = "substring") -> List[Product]:
+        if not query.strip():
+            return self.list_all_products()
+        return self.products.query(*self._search_clause(query, mode))
+
+    @timed("inventory.sort", rows=len)
+    def sorted_products(self, field: str, reverse: bool = False, skus=None) -> List[Product]:
+        products = self._ordered(field, reverse)
+        if skus is None:
+            return list(products)
+        return [product for product in products if product.sku in skus]
+
+    def _ordered(self, field: str, reverse: bool):
+        if field not in self.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by '{field}'. Expected one of: {', '.join(self.SORTABLE_FIELDS)}")
+        direction = "DESC" if reverse else "ASC"
+        return self.products.iter_products(order_by=f"{field} {direction}, sku {direction}")
+
+    @timed("inventory.select", rows=len)
+    def select_products(self, query: Optional[str] = None, sort_field: Optional[str] = None,
+                        reverse: bool = False) -> PagedProducts:
+        where, parameters = self._search_clause(query) if query and query.strip() else ("", ())
+        if sort_field and sort_field not in self.SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort by '{sort_field}'. Expected one of: {', '.join(self.SORTABLE_FIELDS)}")
+        field = sort_field or "sku"
+        direction = "DESC" if reverse else "ASC"
+        return PagedProducts(self.products, where, parameters, f"{field} {direction}, sku {direction}")
+
+    def get_supplier_products(self, supplier_id: str) -> List[Product]:
+        return self.products.query("WHERE supplier_id = ?", (supplier_id,))
+
+    def supplier_summaries(self) -> List[SupplierSummary]:
+        low_stock = dict(self.products._fetchall(
+            "SELECT supplier_id, COUNT(*) FROM products WHERE quantity <= ? GROUP BY supplier_id",
+            (self.LOW_STOCK_THRESHOLD,)))
+        rows = self.products._fetchall("SELECT supplier_id, products, units FROM supplier_totals ORDER BY supplier_id")
+        return [SupplierSummary(supplier_id, self.supplier_name(supplier_id), products, units,
+                                low_stock.get(supplier_id, 0))
+                for supplier_id, products, units in rows]
+
+    def low_stock_by_supplier(self) -> Dict[str, List[Product]]:
+        grouped = {}
+        for product in self.products.query("WHERE quantity <= ?", (self.LOW_STOCK_THRESHOLD,)):
+            grouped.setdefault(product.supplier_id, []).append(product)
+        return grouped
@@ -0,0 +1,109 @@
+import csv
+import os
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Sequence
+
+from .bulk import REQUIRED_COLUMNS, read_frame
+
+# progress(rows_done, total_rows); total_rows is None when it is not known up front.
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+DEFAULT_CHUNKSIZE = 50_000
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def file_format(filepath: str, allowed=("csv", "xlsx", "xls")) -> str:
+    file_extension = filepath.split('.')[-1].lower()
+    if file_extension not in allowed:
+        raise ValueError("Unsupported file format. Please use .csv or .xlsx")
+    return "xlsx" if file_extension == "xls" else file_extension
+
+
+def _is_legacy_xls(filepath: str) -> bool:
+    # Legacy BIFF workbooks: openpyxl cannot open them, only pd.read_excel (via xlrd) can.
+    return filepath.split('.')[-1].lower() == "xls"
+
+
+def xlsx_row_count(filepath: str) -> Optional[int]:
+    if _is_legacy_xls(filepath):
+        return None
+    import openpyxl
+    workbook = openpyxl.load_workbook(filepath, read_only=True)
+    try:
+        max_row = workbook.active.max_row
+        return max_row - 1 if max_row else None
+    finally:
+        workbook.close()
+
+
+def iter_chunks(filepath: str, chunksize: Optional[int] = DEFAULT_CHUNKSIZE) -> Iterator["pd.DataFrame"]:
+    import pandas as pd
+    if chunksize is None or _is_legacy_xls(filepath):
+        yield read_frame(filepath)
+        return
+    if file_format(filepath) == "csv":
+        yield from pd.read_csv(filepath, chunksize=chunksize)
+        return
+
+    import openpyxl
+    workbook = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(value) if value is not None else "" for value in next(rows, ())]
+        batch = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            batch.append(row[:len(header)])
+            if len(batch) == chunksize:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch or not header:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def write_products(filepath: str, products: Iterable, total: Optional[int] = None,
+                   progress: Optional[ProgressCallback] = None, progress_every: int = DEFAULT_CHUNKSIZE):
+    rows = ((product.sku, product.name, product.quantity, product.supplier_id) for product in products)
+    return write_rows(filepath, REQUIRED_COLUMNS, rows, total, progress, progress_every)
+
+
+def write_rows(filepath: str, header: Sequence[str], rows: Iterable[tuple], total: Optional[int] = None,
+               progress: Optional[ProgressCallback] = None, progress_every: int = DEFAULT_CHUNKSIZE):
+    # Written next to the target and renamed into place, so a failed export
+    # never leaves a half-written file behind.
+    fmt = file_format(filepath, allowed=("csv", "xlsx"))
+    tmp_path = f"{filepath}.tmp"
+    written = 0
+    try:
+        if fmt == "csv":
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(header)
+                for row in rows:
+                    writer.writerow(row)
+                    written += 1
+                    if progress and written % progress_every == 0:
+                        progress(written, total)
+        else:
+            import openpyxl
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            sheet.append(list(header))
+            for row in rows:
+                sheet.append(row)
+                written += 1
+                if progress and written % progress_every == 0:
+                    progress(written, total)
+            workbook.save(tmp_path)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if progress:
+        progress(written, total)
+    return written
@@ -0,0 +1,20 @@
+import pytest
+from src.inventory import Product
+
+FRUIT = [
+    ("ABC-1001", "Apples", 10, "SUP1"),
+    ("XYZ-2002", "Bananas", 3, "SUP2"),
+    ("QRS-3003", "Cherries", 7, "SUP1"),
+]
+
+@pytest.fixture
+def stock():
+    """Return a function that adds (sku, name, quantity, supplier_id) rows to an inventory and returns it.
+
+    Without rows it adds Apples, Bananas and Cherries.
+    """
+    def stock(inventory, *rows):
+        for row in rows or FRUIT:
+            inventory.add_product(Product(*row))
+        return inventory
+    return stock
@@ -0,0 +1,39 @@
+import pytest
+from src.inventory import Inventory
+
+def test_apply_adjustments_nets_duplicate_skus(stock):
+    """Test that a batch nets lines per SKU and applies them together."""
+    inventory = stock(Inventory())
+    report = inventory.apply_adjustments([("ABC-1001", -8), ("XYZ-2002", 5), ("ABC-1001", 1)])
+
+    assert report.applied and report.products_changed == 2
+    assert inventory.products["ABC-1001"].quantity == 3
+    assert inventory.products["XYZ-2002"].quantity == 8
+    assert {p.sku for p in inventory.get_low_stock_products()} == {"ABC-1001"}, "The low-stock index should follow the batch"
+
+def test_apply_adjustments_is_all_or_nothing(stock):
+    """Test that one bad line rejects the whole batch and every failing line is reported."""
+    inventory = stock(Inventory())
+    report = inventory.apply_adjustments([("ABC-1001", -2), ("XYZ-2002", -4), ("NOP-9999", 1)])
+
+    assert not report.applied
+    assert [line.line for line in report.errors] == [2, 3]
+    assert inventory.products["ABC-1001"].quantity == 10, "No line should be applied when any line fails"
+
+def test_parse_adjustment_lines():
+    """Test the bulk-mode text format: comma or space separated, blank lines skipped."""
+    from src.batch import parse_adjustment_lines
+    assert parse_adjustment_lines("ABC-1001, 5\n\nXYZ-2002 -3\n") == ([("ABC-1001", 5), ("XYZ-2002", -3)], [1, 3])
+    with pytest.raises(ValueError):
+        parse_adjustment_lines("ABC-1001, five")
+
+def test_batch_report_numbers_source_lines_and_counts_changed_products(stock):
+    """Test that errors point at the textbox line despite blank lines, and netted-out SKUs are not counted."""
+    from src.batch import parse_adjustment_lines
+    inventory = stock(Inventory())
+    report = inventory.apply_adjustments(*parse_adjustment_lines("ABC-1001, 1\n\nNOP-9999, 2\n"))
+    assert [line.line for line in report.errors] == [3], "Line numbers should count the blank line"
+    assert "line 3 (NOP-9999)" in report.summary()
+
+    report = inventory.apply_adjustments([("ABC-1001", 4), ("ABC-1001", -4), ("XYZ-2002", 1)])
+    assert report.products_changed == 1, "A SKU whose lines net to zero is not changed"
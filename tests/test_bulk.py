@@ -0,0 +1,44 @@
+import pytest
+from src.bulk import ImportValidationError
+from src.inventory import Inventory
+
+def write_csv(tmp_path, rows):
+    path = tmp_path / "inventory.csv"
+    path.write_text("sku,name,quantity,supplier_id\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+def test_load_from_file_reports_every_bad_row(tmp_path):
+    """Test that one load reports all invalid rows instead of stopping at the first."""
+    path = write_csv(tmp_path, [
+        "ABC-1001,Apples,10,SUP1",
+        "bad-sku,Broken,4,SUP1",
+        "XYZ-2002,Bananas,-3,SUP2",
+        "ABC-1001,Apples again,7,SUP1",
+        "QRS-3003,Cherries,lots,SUP3",
+    ])
+    inventory = Inventory()
+    with pytest.raises(ImportValidationError) as excinfo:
+        inventory.load_from_file(path)
+
+    lines = [error.line for error in excinfo.value.report.errors]
+    assert lines == [3, 4, 5, 6], "Every invalid row should be reported with its file line"
+    assert inventory.products == {}, "A failed strict load should not touch the inventory"
+
+def test_load_from_file_non_strict_keeps_valid_rows(tmp_path):
+    """Test that a non-strict load ingests the valid rows and returns the report."""
+    path = write_csv(tmp_path, ["ABC-1001,Apples,10,SUP1", "bad-sku,Broken,4,SUP1"])
+    inventory = Inventory()
+    report = inventory.load_from_file(path, strict=False)
+
+    assert report.rows_read == 2 and report.rows_loaded == 1
+    assert list(inventory.products) == ["ABC-1001"]
+    assert inventory.products["ABC-1001"].quantity == 10
+
+def test_rejected_row_does_not_shadow_a_later_valid_duplicate(tmp_path):
+    """Test that a row failing another check does not make a later row with its SKU a duplicate."""
+    path = write_csv(tmp_path, ["ABC-0001,x,bad,S", "ABC-0001,x,4,S"])
+    inventory = Inventory()
+    report = inventory.load_from_file(path, strict=False)
+
+    assert [error.line for error in report.errors] == [2]
+    assert report.rows_loaded == 1 and inventory.products["ABC-0001"].quantity == 4
@@ -0,0 +1,33 @@
+from src.columnar import ColumnarProductStore
+from src.inventory import Inventory, Product
+
+def test_columnar_store_keeps_inventory_contract(stock):
+    """Test that adjust and low-stock queries behave the same on the columnar store."""
+    inventory = stock(Inventory(store=ColumnarProductStore()))
+    inventory.adjust_product_stock("ABC-1001", -6)
+
+    assert inventory.products["ABC-1001"].quantity == 4, "Adjustments should write through to the column"
+    assert {p.sku for p in inventory.get_low_stock_products()} == {"ABC-1001", "XYZ-2002"}
+
+def test_columnar_store_delete_keeps_other_rows_intact(stock):
+    """Test that deleting a row leaves the others intact, including after its slot is reused."""
+    inventory = stock(Inventory(store=ColumnarProductStore()))
+    inventory.delete_product("ABC-1001")
+    inventory.add_product(Product("LMN-4004", "Dates", 1, "SUP3"))
+
+    products = {p.sku: p.to_dict() for p in inventory.list_all_products()}
+    assert products == {
+        "XYZ-2002": {"sku": "XYZ-2002", "name": "Bananas", "quantity": "3", "supplier_id": "SUP2"},
+        "QRS-3003": {"sku": "QRS-3003", "name": "Cherries", "quantity": "7", "supplier_id": "SUP1"},
+        "LMN-4004": {"sku": "LMN-4004", "name": "Dates", "quantity": "1", "supplier_id": "SUP3"},
+    }
+
+def test_columnar_store_bulk_load(tmp_path):
+    """Test that load_from_file fills the columnar store through its column loader."""
+    path = tmp_path / "inventory.csv"
+    path.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,10,SUP1\nXYZ-2002,Bananas,3,SUP2\n")
+    inventory = Inventory(store=ColumnarProductStore())
+    inventory.load_from_file(str(path))
+
+    assert len(inventory.products) == 2
+    assert inventory.products["XYZ-2002"].supplier_id == "SUP2"
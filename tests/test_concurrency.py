@@ -0,0 +1,117 @@
+import sys
+import threading
+from src.concurrency import ConcurrentInventory
+from src.inventory import Product
+
+def test_concurrent_adjustments_lose_no_updates():
+    """Test that adjustments from many threads all land and never drive stock negative."""
+    inventory = ConcurrentInventory(stripes=4)
+    inventory.add_product(Product("ABC-1001", "Apples", 0, "SUP1"))
+    inventory.add_product(Product("XYZ-2002", "Bananas", 1000, "SUP2"))
+    failures = []
+
+    def worker():
+        for _ in range(500):
+            inventory.adjust_product_stock("ABC-1001", 1)
+            try:
+                inventory.adjust_product_stock("XYZ-2002", -1)
+            except ValueError:
+                failures.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert inventory.products["ABC-1001"].quantity == 4000, "Every increment should be kept"
+    assert inventory.products["XYZ-2002"].quantity == 0 and len(failures) == 3000, "Stock should stop at zero"
+    assert inventory.low_stock_count() == 1
+
+def test_checkpoint_holds_off_concurrent_inserts(tmp_path):
+    """Test that a journal checkpoint walks the products while no other thread can insert."""
+    from src.journal import Journal
+
+    class RacingStore(dict):
+        # Adds a product from another thread as soon as a checkpoint starts reading.
+        inventory = None
+
+        def values(self):
+            if self.inventory is not None:
+                inventory, self.inventory = self.inventory, None
+                self.adder = threading.Thread(target=inventory.add_product, args=(Product("ZZZ-9999", "Late", 1, "SUP1"),))
+                self.adder.start()
+                self.adder.join(0.2)
+                self.raced = not self.adder.is_alive()
+            return dict.values(self)
+
+    store = RacingStore()
+    inventory = ConcurrentInventory(store, stripes=4)
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    journal = Journal(str(tmp_path / "inventory.wal"), str(tmp_path / "inventory.invsnap"))
+    inventory.attach_journal(journal)
+
+    store.inventory = inventory
+    inventory.checkpoint()
+    store.adder.join()
+    journal.close()
+
+    assert not store.raced, "The insert should wait until the checkpoint has finished"
+    assert "ZZZ-9999" in inventory.products
+
+def test_load_from_file_does_not_block_adjustments_while_parsing(tmp_path):
+    """Test that a file load only holds the stripes for the swap, not while the file is parsed."""
+    inventory = ConcurrentInventory(stripes=4)
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    path = tmp_path / "inventory.csv"
+    path.write_text("sku,name,quantity,supplier_id\nXYZ-2002,Bananas,3,SUP2\n")
+    finished = []
+
+    def adjust_meanwhile(done, total):
+        adjuster = threading.Thread(target=inventory.adjust_product_stock, args=("ABC-1001", 1))
+        adjuster.start()
+        adjuster.join(1)
+        finished.append(not adjuster.is_alive())
+
+    inventory.load_from_file(str(path), chunksize=1, progress=adjust_meanwhile)
+    assert finished == [True], "An adjustment should not wait for the file to be parsed"
+    assert list(inventory.products) == ["XYZ-2002"]
+
+def test_queries_stay_consistent_while_another_thread_mutates():
+    """Test that search and sort queries from one thread never fail while another adds and deletes."""
+    inventory = ConcurrentInventory(stripes=4)
+    for i in range(200):
+        inventory.add_product(Product(f"ABC-{i:04d}", f"Cable {i}", i % 9, "SUP1"))
+    errors = []
+    done = threading.Event()
+
+    def mutate():
+        for round_ in range(20):
+            for i in range(200):
+                inventory.delete_product(f"ABC-{i:04d}")
+                inventory.add_product(Product(f"ABC-{i:04d}", f"Cable {i}", (i + round_) % 9, "SUP1"))
+        done.set()
+
+    def query():
+        while not done.is_set():
+            try:
+                inventory.select_products("cable 1", "quantity")
+                inventory.select_products("ca", "name", reverse=True)
+                inventory.search_products("cable")
+            except Exception as e:
+                errors.append(e)
+                return
+
+    threads = [threading.Thread(target=mutate), threading.Thread(target=query)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave the threads as finely as possible.
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == [], "Queries should only ever see products and indexes that agree"
+    assert [p.sku for p in inventory.select_products("cable 19", "sku")] == ["ABC-0019"] + [f"ABC-{i:04d}" for i in range(190, 200)]
@@ -29,4 +29,26 @@ def test_get_low_stock_products():
     assert len(low_stock_items) == 2, "There should be exactly 2 low-stock items"
     assert "LOW-0020" in low_stock_skus, "LOW-0020 should be in the low-stock list"
     assert "MID-0030" in low_stock_skus, "MID-0030 should be in the low-stock list"
-    assert "HIG-0010" not in low_stock_skus, "HIG-0010 should not be in the low-stock list"
\ No newline at end of file
+    assert "HIG-0010" not in low_stock_skus, "HIG-0010 should not be in the low-stock list"
+
+
+def test_low_stock_index_follows_mutations_and_threshold_changes():
+    """Test that the low-stock index tracks adjust/delete and runtime threshold changes."""
+    inventory = Inventory()
+    inventory.add_product(Product("HIG-0010", "High Stock Item", 10, "SUP1"))
+    inventory.add_product(Product("LOW-0020", "Low Stock Item", 3, "SUP2"))
+    inventory.add_product(Product("CRT-0030", "Critical Item", 1, "SUP3"))
+
+    inventory.adjust_product_stock("HIG-0010", -6)
+    inventory.delete_product("LOW-0020")
+    assert {p.sku for p in inventory.get_low_stock_products()} == {"HIG-0010", "CRT-0030"}
+    assert inventory.critical_stock_count() == 1, "Only CRT-0030 should be critical"
+
+    inventory.LOW_STOCK_THRESHOLD = 2
+    assert inventory.low_stock_count() == 1, "Lowering the threshold should shrink the low-stock set"
+
+def test_importing_inventory_does_not_import_pandas():
+    """Test that pandas stays out of the import path until a file is actually read."""
+    import subprocess
+    code = "import sys, src.inventory; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0, "src.inventory should import pandas lazily"
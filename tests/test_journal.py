@@ -0,0 +1,102 @@
+from src.inventory import Inventory, Product
+from src.journal import Journal
+
+def open_inventory(tmp_path, **journal_options):
+    inventory = Inventory()
+    snapshot_path = str(tmp_path / "inventory.invsnap")
+    journal_path = str(tmp_path / "inventory.wal")
+    if (tmp_path / "inventory.invsnap").exists():
+        inventory.load_snapshot(snapshot_path)
+    inventory.replay_journal(journal_path)
+    journal = Journal(journal_path, snapshot_path, **journal_options)
+    inventory.attach_journal(journal)
+    return inventory, journal
+
+def test_journal_replays_unsaved_changes(tmp_path):
+    """Test that snapshot plus journal replay restore every mutation made since the last checkpoint."""
+    inventory, journal = open_inventory(tmp_path)
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    inventory.checkpoint()
+    inventory.add_product(Product("XYZ-2002", "Bananas", 3, "SUP2"))
+    inventory.adjust_product_stock("ABC-1001", -4)
+    inventory.delete_product("XYZ-2002")
+    inventory.add_product(Product("XYZ-2002", "Plantains", 8, "SUP3"))
+    journal.sync()
+
+    restored, _ = open_inventory(tmp_path)
+    assert {p.sku: p.to_dict() for p in restored.list_all_products()} == {p.sku: p.to_dict() for p in inventory.list_all_products()}
+    assert restored.low_stock_count() == 0
+
+def test_journal_ignores_torn_tail(tmp_path):
+    """Test that a partially written last record is dropped and later records still append cleanly."""
+    inventory, journal = open_inventory(tmp_path)
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    inventory.adjust_product_stock("ABC-1001", 5)
+    journal.close()
+    wal = tmp_path / "inventory.wal"
+    wal.write_bytes(wal.read_bytes()[:-3])
+
+    restored, journal = open_inventory(tmp_path)
+    assert restored.products["ABC-1001"].quantity == 10, "The torn adjustment should not be replayed"
+    restored.adjust_product_stock("ABC-1001", 1)
+    journal.close()
+    assert open_inventory(tmp_path)[0].products["ABC-1001"].quantity == 11
+
+def test_journal_compacts_into_snapshot(tmp_path):
+    """Test that the log is folded into the snapshot after compact_every records."""
+    inventory, journal = open_inventory(tmp_path, compact_every=3)
+    for i in range(4):
+        inventory.add_product(Product(f"ABC-100{i}", "Item", i, "SUP1"))
+    journal.close()
+
+    assert journal.records_since_checkpoint == 1
+    assert len(open_inventory(tmp_path)[0].products) == 4
+
+def test_unsaved_edits_survive_a_save_then_crash(tmp_path):
+    """Test that edits journaled after saving to the CSV are restored even though the CSV is newer."""
+    import os
+    from src.main import load_initial_inventory
+
+    data_file = str(tmp_path / "inventory.csv")
+    inventory = Inventory()
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    inventory.save_to_file(data_file)
+    journal = load_initial_inventory(inventory, data_file)
+
+    inventory.save_to_file(data_file)
+    inventory.adjust_product_stock("ABC-1001", -4)
+    inventory.add_product(Product("XYZ-2002", "Bananas", 3, "SUP2"))
+    journal.sync()
+    # Crash: no checkpoint, and the CSV is newer than the snapshot.
+    os.utime(data_file, (os.path.getmtime(data_file) + 60,) * 2)
+
+    restored = Inventory()
+    load_initial_inventory(restored, data_file).close()
+    assert restored.products["ABC-1001"].quantity == 6, "The adjustment made after the save should be replayed"
+    assert "XYZ-2002" in restored.products, "The product added after the save should be replayed"
+
+def test_delete_on_compaction_boundary_stays_deleted(tmp_path):
+    """Test that a delete whose record triggers compaction is not written back into the snapshot."""
+    inventory, journal = open_inventory(tmp_path, compact_every=3)
+    inventory.add_product(Product("ABC-0001", "Item", 1, "SUP1"))
+    inventory.add_product(Product("ABC-0002", "Item", 2, "SUP1"))
+    inventory.delete_product("ABC-0001")
+    journal.close()
+
+    assert list(open_inventory(tmp_path)[0].products) == ["ABC-0002"], "The deleted product should not come back"
+
+def test_torn_batch_is_not_replayed_in_part(tmp_path):
+    """Test that a batch of adjustments is journaled as one record and a torn batch is dropped whole."""
+    inventory, journal = open_inventory(tmp_path, group_size=1)
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    inventory.add_product(Product("XYZ-2002", "Bananas", 3, "SUP2"))
+    inventory.apply_adjustments([("ABC-1001", -4), ("XYZ-2002", 5)])
+    journal.close()
+    assert {sku: p.quantity for sku, p in open_inventory(tmp_path)[0].products.items()} == {"ABC-1001": 6, "XYZ-2002": 8}
+
+    wal = tmp_path / "inventory.wal"
+    wal.write_bytes(wal.read_bytes()[:-3])
+    restored, journal = open_inventory(tmp_path)
+    journal.close()
+    assert {sku: p.quantity for sku, p in restored.products.items()} == {"ABC-1001": 10, "XYZ-2002": 3}, \
+        "No adjustment from a torn batch should be replayed"
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+from src.inventory import Inventory
+from src.metrics import METRICS
+
+@pytest.fixture
+def metrics():
+    METRICS.reset()
+    METRICS.enable()
+    yield METRICS
+    METRICS.disable()
+    METRICS.reset()
+
+def test_metrics_are_off_by_default(stock):
+    """Test that instrumented calls record nothing unless metrics are enabled."""
+    METRICS.reset()
+    stock(Inventory()).adjust_product_stock("ABC-1001", 1)
+    assert METRICS.snapshot() == {"timers": {}, "counters": {}, "gauges": {}}
+
+def test_metrics_time_core_operations(tmp_path, metrics, stock):
+    """Test that load, save, adjust and search record timings and row counts."""
+    inventory = stock(Inventory())
+    path = str(tmp_path / "inventory.csv")
+    inventory.save_to_file(path)
+    inventory.load_from_file(path)
+    inventory.adjust_product_stock("ABC-1001", -1)
+    inventory.adjust_product_stock("ABC-1001", -1)
+    inventory.search_skus("app")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["timers"]["inventory.adjust"]["count"] == 2
+    assert snapshot["counters"]["inventory.save.rows"] == 3
+    assert snapshot["counters"]["inventory.load.rows"] == 3
+    assert snapshot["counters"]["inventory.search.rows"] == 1
+
+def test_metrics_export_formats(tmp_path, metrics, stock):
+    """Test that metrics export as JSON and as Prometheus text."""
+    stock(Inventory()).adjust_product_stock("ABC-1001", 1)
+    metrics.write(str(tmp_path / "metrics.json"))
+    metrics.write(str(tmp_path / "metrics.prom"))
+
+    assert json.loads((tmp_path / "metrics.json").read_text())["timers"]["inventory.adjust"]["count"] == 1
+    prometheus = (tmp_path / "metrics.prom").read_text()
+    assert 'inventory_inventory_adjust_seconds_bucket{le="+Inf"} 1' in prometheus
+    assert "inventory_inventory_adjust_seconds_count 1" in prometheus
@@ -0,0 +1,45 @@
+import pytest
+from src.bulk import ImportValidationError
+from src.inventory import Inventory
+
+def write_branches(tmp_path):
+    north = tmp_path / "north.csv"
+    north.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,10,SUP1\nXYZ-2002,Bananas,3,SUP2\n")
+    south = tmp_path / "south.csv"
+    south.write_text("sku,name,quantity,supplier_id\nXYZ-2002,Bananas (south),4,SUP3\nQRS-3003,Cherries,7,SUP1\n")
+    return [str(north), str(south)]
+
+@pytest.mark.parametrize("policy, quantity, supplier", [("sum", 7, "SUP3"), ("last", 4, "SUP3")])
+def test_load_from_files_merges_branches(tmp_path, policy, quantity, supplier):
+    """Test that SKUs listed by several branch files are merged by the conflict policy."""
+    inventory = Inventory()
+    report = inventory.load_from_files(write_branches(tmp_path), policy=policy, workers=2)
+
+    assert sorted(inventory.products) == ["ABC-1001", "QRS-3003", "XYZ-2002"]
+    assert inventory.products["XYZ-2002"].quantity == quantity, f"'{policy}' should resolve the duplicate"
+    assert inventory.products["XYZ-2002"].supplier_id == supplier
+    assert report.rows_read == 4 and report.rows_loaded == 3 and report.conflicts == 1
+
+def test_load_from_files_reject_policy(tmp_path):
+    """Test that the reject policy reports cross-file duplicates and leaves the inventory untouched."""
+    inventory = Inventory()
+    with pytest.raises(ImportValidationError) as excinfo:
+        inventory.load_from_files(write_branches(tmp_path), policy="reject", workers=1)
+
+    errors = excinfo.value.report.errors
+    assert [(e.line, e.sku) for e in errors] == [(2, "XYZ-2002")], "The later occurrence should be reported"
+    assert "south.csv" in errors[0].message and "north.csv" in errors[0].message
+    assert inventory.products == {}
+
+def test_load_from_files_accepts_header_only_workbook(tmp_path):
+    """Test that a branch workbook with only a header row merges as an empty file in a chunked load."""
+    import openpyxl
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["sku", "name", "quantity", "supplier_id"])
+    empty = tmp_path / "east.xlsx"
+    workbook.save(empty)
+
+    inventory = Inventory()
+    report = inventory.load_from_files(write_branches(tmp_path) + [str(empty)], workers=1, chunksize=10)
+    assert sorted(inventory.products) == ["ABC-1001", "QRS-3003", "XYZ-2002"]
+    assert report.files[str(empty)].rows_read == 0
@@ -0,0 +1,41 @@
+import pytest
+from src.inventory import Inventory
+from src.reconcile import Added, Changed, Removed, diff_files
+from src.sqlite_store import SQLiteInventory
+
+def write_count(tmp_path):
+    path = tmp_path / "count.csv"
+    path.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,8,SUP1\nXYZ-2002,Bananas,3,SUP2\n"
+                    "DEF-4004,Dates,5,SUP3\nbad,Figs,1,SUP3\n")
+    return str(path)
+
+@pytest.mark.parametrize("backend", [Inventory, SQLiteInventory])
+def test_reconcile_reports_differences_without_loading(tmp_path, backend, stock):
+    """Test that a count file is diffed against the live inventory, which stays untouched."""
+    inventory = stock(backend())
+    result = inventory.reconcile(write_count(tmp_path), chunksize=2)
+
+    assert result.changed == [Changed("ABC-1001", 10, 8)]
+    assert result.added == [Added("DEF-4004", "Dates", 5, "SUP3")]
+    assert result.removed == [Removed("QRS-3003", "Cherries", 7)]
+    assert result.unchanged == 1 and result.rows_read == 4
+    assert [e.line for e in result.errors] == [5], "Invalid count rows should be reported, not applied"
+    assert inventory.products["ABC-1001"].quantity == 10, "The inventory should be unchanged"
+
+def test_reconcile_applies_deltas_as_one_batch(tmp_path, stock):
+    """Test that the reconciliation deltas bring the inventory in line with the count."""
+    inventory = stock(Inventory())
+    result = inventory.reconcile(write_count(tmp_path))
+    report = inventory.apply_adjustments(result.adjustments(zero_missing=True))
+
+    assert report.applied
+    assert {sku: p.quantity for sku, p in inventory.products.items()} == {"ABC-1001": 8, "XYZ-2002": 3, "QRS-3003": 0}
+
+def test_diff_files_compares_two_exports(tmp_path, stock):
+    """Test that two export files can be compared with each other."""
+    old = tmp_path / "old.csv"
+    stock(Inventory()).save_to_file(str(old))
+    result = diff_files(str(old), write_count(tmp_path))
+
+    assert [c.delta for c in result.changed] == [-2]
+    assert [r.sku for r in result.removed] == ["QRS-3003"]
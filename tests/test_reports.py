@@ -0,0 +1,58 @@
+import pytest
+from src.inventory import Inventory, Supplier
+from src.reports import ReorderLine, SupplierSummary, build_purchase_orders, write_purchase_orders
+from src.sqlite_store import SQLiteInventory
+
+@pytest.fixture
+def stock_orchard(stock):
+    def stock_orchard(inventory):
+        inventory.add_supplier(Supplier("SUP1", "Orchard Ltd"))
+        return stock(inventory, ("ABC-1001", "Apples", 10, "SUP1"), ("QRS-3003", "Cherries", 2, "SUP1"), ("XYZ-2002", "Bananas", 4, "SUP2"))
+    return stock_orchard
+
+@pytest.mark.parametrize("backend", [Inventory, SQLiteInventory])
+def test_supplier_totals_follow_mutations(backend, stock_orchard):
+    """Test that per-supplier totals stay in sync with adds, adjustments and deletes."""
+    inventory = stock_orchard(backend())
+    assert inventory.supplier_summaries() == [
+        SupplierSummary("SUP1", "Orchard Ltd", 2, 12, 1),
+        SupplierSummary("SUP2", "SUP2", 1, 4, 1),
+    ]
+
+    inventory.adjust_product_stock("ABC-1001", -7)
+    inventory.apply_adjustments([("XYZ-2002", 6)])
+    inventory.delete_product("QRS-3003")
+    assert inventory.supplier_summaries() == [
+        SupplierSummary("SUP1", "Orchard Ltd", 1, 3, 1),
+        SupplierSummary("SUP2", "SUP2", 1, 10, 0),
+    ], "Totals should be updated incrementally"
+    assert [p.sku for p in inventory.get_supplier_products("SUP1")] == ["ABC-1001"]
+
+def test_purchase_orders_group_low_stock_by_supplier(tmp_path, stock_orchard):
+    """Test that the reorder report tops low-stock products up per supplier and exports them."""
+    inventory = stock_orchard(Inventory())
+    orders = build_purchase_orders(inventory, target_level=20)
+
+    assert [(order.supplier_id, order.supplier_name) for order in orders] == [("SUP1", "Orchard Ltd"), ("SUP2", "SUP2")]
+    assert orders[0].lines == (ReorderLine("QRS-3003", "Cherries", 2, 18),)
+    assert orders[1].total_units == 16
+
+    path = tmp_path / "orders.csv"
+    assert write_purchase_orders(str(path), orders) == 2
+    assert path.read_text().splitlines() == [
+        "supplier_id,supplier_name,sku,name,quantity,order_quantity",
+        "SUP1,Orchard Ltd,QRS-3003,Cherries,2,18",
+        "SUP2,SUP2,XYZ-2002,Bananas,4,16",
+    ]
+
+@pytest.mark.parametrize("backend", [Inventory, SQLiteInventory])
+def test_supplier_reports_follow_threshold_changes(backend, stock_orchard):
+    """Test that supplier summaries and purchase orders use the current low-stock threshold."""
+    inventory = stock_orchard(backend())
+    inventory.supplier_summaries()
+    inventory.LOW_STOCK_THRESHOLD = 10
+
+    assert [s.low_stock for s in inventory.supplier_summaries()] == [2, 1], \
+        "Raising the threshold should count ABC-1001 as low stock"
+    orders = build_purchase_orders(inventory, target_level=20)
+    assert [line.sku for line in orders[0].lines] == ["ABC-1001", "QRS-3003"]
@@ -0,0 +1,84 @@
+import sys
+import threading
+import pytest
+from src.inventory import Inventory, Product
+
+ROWS = [
+    ("ABC-1001", "Green Apples", 10, "SUP1"),
+    ("ABD-2002", "Bananas", 3, "SUP2"),
+    ("XYZ-3003", "Red Apple Juice", 7, "SUP1"),
+]
+
+def skus(products):
+    return [p.sku for p in products]
+
+def test_search_matches_sku_or_name_substring(stock):
+    """Test that substring search matches the SKU or name case-insensitively, as the old scan did."""
+    inventory = stock(Inventory(), *ROWS)
+
+    assert skus(inventory.search_products("APPLE")) == ["ABC-1001", "XYZ-3003"]
+    assert skus(inventory.search_products("ab")) == ["ABC-1001", "ABD-2002"]
+    assert skus(inventory.search_products("apples")) == ["ABC-1001"], "Narrowing a query should filter the previous result"
+
+def test_search_index_stays_in_sync_with_mutations(stock):
+    """Test that adds and deletes after the index is built are reflected in results."""
+    inventory = stock(Inventory(), *ROWS)
+    inventory.search_products("apple")
+
+    inventory.delete_product("ABC-1001")
+    inventory.add_product(Product("QRS-4004", "Apple Pie", 2, "SUP3"))
+    assert skus(inventory.search_products("apple")) == ["QRS-4004", "XYZ-3003"]
+
+def test_search_prefix_and_token_modes(stock):
+    """Test SKU prefix mode and the name token mode."""
+    inventory = stock(Inventory(), *ROWS)
+
+    assert skus(inventory.search_products("abd", mode="prefix")) == ["ABD-2002"]
+    assert skus(inventory.search_products("app re", mode="token")) == ["XYZ-3003"]
+    with pytest.raises(ValueError):
+        inventory.search_products("apple", mode="regex")
+
+def test_sorted_products_follow_stock_adjustments(stock):
+    """Test that the quantity ordering stays correct after adjustments, with and without a filter."""
+    inventory = stock(Inventory(), *ROWS)
+    assert skus(inventory.sorted_products("quantity")) == ["ABD-2002", "XYZ-3003", "ABC-1001"]
+
+    inventory.adjust_product_stock("ABD-2002", 20)
+    inventory.add_product(Product("QRS-4004", "Apple Pie", 8, "SUP3"))
+    assert skus(inventory.sorted_products("quantity", reverse=True)) == ["ABD-2002", "ABC-1001", "QRS-4004", "XYZ-3003"]
+    assert skus(inventory.sorted_products("name", skus=inventory.search_skus("apple"))) == ["QRS-4004", "ABC-1001", "XYZ-3003"]
+
+def test_sorted_walk_keeps_its_order_while_products_are_added(stock):
+    """Test that a lazily consumed sorted walk sees the order it started with, even if a product is added meanwhile."""
+    from src.indexes import SortIndex
+
+    index = SortIndex("quantity")
+    index.rebuild(stock(Inventory(), *ROWS).list_all_products())
+    walk = index.skus()
+    first = next(walk)
+    index.add(Product("AAA-0001", "Zero Stock", 0, "SUP1"))
+
+    assert [first, *walk] == ["ABD-2002", "XYZ-3003", "ABC-1001"], "A walk should not pick up or repeat entries"
+    assert list(index.skus()) == ["AAA-0001", "ABD-2002", "XYZ-3003", "ABC-1001"]
+
+def test_search_racing_an_add_is_not_reused():
+    """Test that a search result computed while another thread adds a product never hides it from narrower queries."""
+    from src.indexes import SearchIndex
+
+    products = [Product(f"ABC-{i:04d}", f"Apple {i}", i, "SUP1") for i in range(2000)]
+    pie = Product("QRS-4004", "Apple Pie", 2, "SUP3")
+    index = SearchIndex()
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Interleave the threads as finely as possible.
+    try:
+        for _ in range(50):
+            index.rebuild(products)
+            go = threading.Event()
+            adder = threading.Thread(target=lambda: go.wait() and index.add(pie))
+            adder.start()
+            go.set()
+            index.search("app")
+            adder.join()
+            assert "QRS-4004" in index.search("apple pie"), "A result computed during an add should not be reused"
+    finally:
+        sys.setswitchinterval(interval)
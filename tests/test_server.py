@@ -0,0 +1,92 @@
+import asyncio
+import json
+from src.inventory import Inventory, Product
+from src.server import InventoryServer
+
+async def request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nConnection: close\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    if b"chunked" in head:
+        chunks, rest = [], payload
+        while True:
+            size, _, rest = rest.partition(b"\r\n")
+            if int(size, 16) == 0:
+                break
+            chunks.append(rest[:int(size, 16)])
+            rest = rest[int(size, 16) + 2:]
+        payload = b"".join(chunks)
+    return status, json.loads(payload)
+
+def run_with_server(scenario):
+    inventory = Inventory()
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    inventory.add_product(Product("XYZ-2002", "Bananas", 3, "SUP2"))
+
+    async def main():
+        server = InventoryServer(inventory, batch_window=0.01)
+        port = await server.start(port=0)
+        try:
+            return await scenario(port)
+        finally:
+            await server.stop()
+    return inventory, asyncio.run(main())
+
+def test_server_lookup_search_and_low_stock():
+    """Test the read endpoints, including the streamed listings."""
+    async def scenario(port):
+        return (await request(port, "GET", "/products/ABC-1001"),
+                await request(port, "GET", "/products?q=ban"),
+                await request(port, "GET", "/low-stock"),
+                await request(port, "GET", "/products/NOP-0000"))
+    _, (lookup, search, low_stock, missing) = run_with_server(scenario)
+
+    assert lookup == (200, {"sku": "ABC-1001", "name": "Apples", "quantity": 10, "supplier_id": "SUP1"})
+    assert search[0] == 200 and [p["sku"] for p in search[1]] == ["XYZ-2002"]
+    assert [p["sku"] for p in low_stock[1]] == ["XYZ-2002"]
+    assert missing[0] == 404
+
+def test_server_coalesces_concurrent_adjustments():
+    """Test that concurrent adjust requests share a batch and failing ones get their own error."""
+    async def scenario(port):
+        return await asyncio.gather(
+            request(port, "POST", "/products/ABC-1001/adjust", {"amount": -4}),
+            request(port, "POST", "/products/ABC-1001/adjust", {"amount": 2}),
+            request(port, "POST", "/products/XYZ-2002/adjust", {"amount": -5}),
+            request(port, "POST", "/products/XYZ-2002/adjust", {"amount": "x"}),
+        )
+    inventory, responses = run_with_server(scenario)
+
+    assert [status for status, _ in responses] == [200, 200, 409, 400]
+    assert inventory.products["ABC-1001"].quantity == 8
+    assert inventory.products["XYZ-2002"].quantity == 3, "A rejected adjustment must not change stock"
+
+def test_server_survives_a_failing_batch():
+    """Test that an unexpected error fails its batch with 500 and later adjustments still get answers."""
+    inventory = Inventory()
+    inventory.add_product(Product("ABC-1001", "Apples", 10, "SUP1"))
+    apply_adjustments = inventory.apply_adjustments
+
+    def fail_once(lines):
+        inventory.apply_adjustments = apply_adjustments
+        raise OSError("disk full")
+    inventory.apply_adjustments = fail_once
+
+    async def main():
+        server = InventoryServer(inventory, batch_window=0.01)
+        port = await server.start(port=0)
+        try:
+            failed = await asyncio.wait_for(request(port, "POST", "/products/ABC-1001/adjust", {"amount": 1}), 5)
+            retried = await asyncio.wait_for(request(port, "POST", "/products/ABC-1001/adjust", {"amount": 1}), 5)
+            return failed, retried
+        finally:
+            await server.stop()
+    failed, retried = asyncio.run(main())
+
+    assert failed[0] == 500, "An unexpected error should be reported as 500"
+    assert retried == (200, {"sku": "ABC-1001", "quantity": 11}), "The batcher should keep serving after a failure"
+    assert inventory.products["ABC-1001"].quantity == 11
@@ -0,0 +1,46 @@
+import os
+import pytest
+from src.columnar import ColumnarProductStore
+from src.inventory import Inventory
+from src.main import load_initial_inventory
+
+ROWS = [
+    ("ABC-1001", "Äpfel", 10, "SUP1"),
+    ("XYZ-2002", "Bananas", 3, "SUP1"),
+    ("QRS-3003", "", 0, "SUP2"),
+]
+
+def test_snapshot_round_trip(tmp_path, stock):
+    """Test that a snapshot restores every field, including non-ASCII and empty strings, into any store."""
+    path = str(tmp_path / "inventory.invsnap")
+    stock(Inventory(), *ROWS).save_snapshot(path)
+
+    for inventory in (Inventory(), Inventory(store=ColumnarProductStore())):
+        inventory.load_snapshot(path)
+        assert [p.to_dict() for p in inventory.list_all_products()] == [p.to_dict() for p in stock(Inventory(), *ROWS).list_all_products()]
+        assert inventory.low_stock_count() == 2, "Indexes should be rebuilt after a snapshot load"
+
+def test_load_snapshot_rejects_other_files(tmp_path):
+    """Test that a file that is not a snapshot raises ValueError."""
+    path = tmp_path / "inventory.invsnap"
+    path.write_text("sku,name,quantity,supplier_id\n")
+    with pytest.raises(ValueError):
+        Inventory().load_snapshot(str(path))
+
+def test_startup_prefers_fresh_snapshot(tmp_path, stock):
+    """Test that startup writes a snapshot from the CSV and uses it until the CSV is newer."""
+    csv_path = tmp_path / "inventory.csv"
+    csv_path.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,10,SUP1\n")
+    load_initial_inventory(Inventory(), str(csv_path))
+    snapshot_path = tmp_path / "inventory.invsnap"
+    assert snapshot_path.exists()
+
+    stock(Inventory(), *ROWS).save_snapshot(str(snapshot_path))
+    inventory = Inventory()
+    load_initial_inventory(inventory, str(csv_path))
+    assert len(inventory.products) == 3, "A snapshot newer than the CSV should be used"
+
+    os.utime(csv_path, (snapshot_path.stat().st_mtime + 10,) * 2)
+    inventory = Inventory()
+    load_initial_inventory(inventory, str(csv_path))
+    assert list(inventory.products) == ["ABC-1001"], "A newer CSV should win over the snapshot"
@@ -0,0 +1,57 @@
+import pytest
+
+from src.bulk import ImportValidationError
+from src.sqlite_store import PagedProducts, SQLiteInventory
+
+ROWS = [
+    ("ABC-1001", "Green Apples", 10, "SUP1"),
+    ("XYZ-2002", "Bananas", 3, "SUP2"),
+    ("QRS-3003", "Red Apples", 1, "SUP1"),
+]
+
+def test_sqlite_inventory_keeps_inventory_contract(tmp_path, stock):
+    """Test that adjustments, low-stock queries and deletes persist in the database file."""
+    path = str(tmp_path / "inventory.db")
+    inventory = stock(SQLiteInventory(path), *ROWS)
+    inventory.adjust_product_stock("ABC-1001", -6)
+    with pytest.raises(ValueError):
+        inventory.adjust_product_stock("XYZ-2002", -4)
+    with pytest.raises(KeyError):
+        inventory.adjust_product_stock("NOP-0000", 1)
+    inventory.delete_product("QRS-3003")
+
+    reopened = SQLiteInventory(path)
+    assert reopened.products["ABC-1001"].quantity == 4, "Adjustments should be written to the database"
+    assert [p.sku for p in reopened.get_low_stock_products()] == ["XYZ-2002", "ABC-1001"]
+    assert reopened.low_stock_count() == 2 and "QRS-3003" not in reopened.products
+    with pytest.raises(TypeError):
+        reopened.attach_journal(None)
+
+def test_sqlite_inventory_pages_search_and_sort_from_sql(stock):
+    """Test that select_products returns a lazily paged, filtered and sorted view."""
+    inventory = stock(SQLiteInventory(), *ROWS)
+    view = inventory.select_products("apples", "quantity", reverse=True)
+
+    assert isinstance(view, PagedProducts), "Results should be paged from the database, not materialised"
+    assert len(view) == 2
+    assert [p.sku for p in view[0:2]] == ["ABC-1001", "QRS-3003"]
+    assert view[-1].name == "Red Apples"
+    assert inventory.search_skus("ABC", mode="prefix") == {"ABC-1001"}
+    assert inventory.search_skus("app", mode="token") == {"ABC-1001", "QRS-3003"}
+
+def test_sqlite_inventory_import_is_all_or_nothing(tmp_path):
+    """Test that a strict import streams into the table and a failed one rolls back."""
+    good = tmp_path / "good.csv"
+    good.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,10,SUP1\nXYZ-2002,Bananas,3,SUP2\n")
+    bad = tmp_path / "bad.csv"
+    bad.write_text("sku,name,quantity,supplier_id\nDEF-4004,Dates,1,SUP3\nbad,Figs,1,SUP3\n")
+    inventory = SQLiteInventory()
+    inventory.load_from_file(str(good), chunksize=1)
+
+    with pytest.raises(ImportValidationError):
+        inventory.load_from_file(str(bad), chunksize=1)
+    assert sorted(inventory.products) == ["ABC-1001", "XYZ-2002"], "A failed import should leave the table as it was"
+
+    out = tmp_path / "out.csv"
+    inventory.save_to_file(str(out))
+    assert out.read_text().splitlines()[1:] == ["ABC-1001,Apples,10,SUP1", "XYZ-2002,Bananas,3,SUP2"]
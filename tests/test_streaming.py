@@ -0,0 +1,46 @@
+import pytest
+from src.bulk import ImportValidationError
+from src.inventory import Inventory
+
+def rows(count):
+    return [(f"ABC-{i:04d}", f"Item {i}", i % 7, f"SUP{i % 3}") for i in range(count)]
+
+@pytest.mark.parametrize("extension", ["csv", "xlsx"])
+def test_chunked_round_trip_with_progress(tmp_path, extension, stock):
+    """Test that a streamed save and chunked load round-trip the inventory and report progress."""
+    path = str(tmp_path / f"inventory.{extension}")
+    saved_progress, loaded_progress = [], []
+    stock(Inventory(), *rows(25)).save_to_file(path, progress=lambda done, total: saved_progress.append((done, total)))
+
+    inventory = Inventory()
+    report = inventory.load_from_file(path, chunksize=10, progress=lambda done, total: loaded_progress.append(done))
+
+    assert report.rows_loaded == 25
+    assert inventory.products["ABC-0013"].to_dict() == {"sku": "ABC-0013", "name": "Item 13", "quantity": "6", "supplier_id": "SUP1"}
+    assert saved_progress[-1] == (25, 25), "The final save progress should report every row"
+    assert loaded_progress == [10, 20, 25], "Load progress should be reported once per chunk"
+
+def test_chunked_load_catches_duplicates_across_chunks(tmp_path, stock):
+    """Test that duplicate SKUs split across chunk boundaries are still reported, with file lines."""
+    path = tmp_path / "inventory.csv"
+    path.write_text("sku,name,quantity,supplier_id\nABC-1001,Apples,10,SUP1\nXYZ-2002,Bananas,3,SUP2\nABC-1001,Apples,4,SUP1\n")
+    inventory = stock(Inventory(), *rows(2))
+
+    with pytest.raises(ImportValidationError) as excinfo:
+        inventory.load_from_file(str(path), chunksize=2)
+    assert [error.line for error in excinfo.value.report.errors] == [4]
+    assert len(inventory.products) == 2, "A rejected load should leave the current inventory in place"
+
+def test_chunked_load_reads_legacy_xls_whole(tmp_path, monkeypatch):
+    """Test that a chunked load of a legacy .xls goes through pandas instead of openpyxl."""
+    import pandas as pd
+    import src.streaming
+
+    path = tmp_path / "inventory.xls"
+    path.write_bytes(b"\xd0\xcf\x11\xe0")
+    frame = pd.DataFrame({"sku": ["ABC-1001"], "name": ["Apples"], "quantity": [10], "supplier_id": ["SUP1"]})
+    monkeypatch.setattr(src.streaming, "read_frame", lambda filepath: frame)
+
+    inventory = Inventory()
+    report = inventory.load_from_file(str(path), chunksize=10, progress=lambda done, total: None)
+    assert report.rows_loaded == 1 and inventory.products["ABC-1001"].quantity == 10